@@ -7,6 +7,9 @@ This agent manages Vector Search operations with temporal context awareness.
 from google.adk.agents import Agent
 from typing import List, Dict, Any, Optional
 import json
+import os
+import traceback
+import uuid
 from datetime import datetime
 
 from vector_search_manager import VectorSearchManager
@@ -54,7 +57,6 @@ class TemporalRAGAgent:
 
         # Create ADK agent with tool functions
         # Configure Vertex AI credentials via environment variables
-        import os
         os.environ['GOOGLE_GENAI_USE_VERTEXAI'] = 'true'
         os.environ['GOOGLE_CLOUD_PROJECT'] = settings.google_cloud_project
         os.environ['GOOGLE_CLOUD_LOCATION'] = settings.google_cloud_location
@@ -255,7 +257,6 @@ IMPORTANT Response Guidelines:
 
             # Use provided session_id or create a new one
             if not session_id:
-                import uuid
                 session_id = str(uuid.uuid4())
                 logger.info(f"Creating new session: {session_id}")
 
@@ -318,7 +319,6 @@ IMPORTANT Response Guidelines:
 
         except Exception as e:
             logger.error(f"Error processing message: {str(e)}")
-            import traceback
             logger.error(traceback.format_exc())
             return {
                 "response": f"Error: {str(e)}",
@@ -352,6 +352,44 @@ class DocumentParser:
             logger.error(f"Error parsing PDF: {str(e)}")
             raise ValueError(f"Failed to parse PDF: {str(e)}")
 
+    @staticmethod
+    def parse_pdf_full(file_bytes: bytes) -> Dict[str, Any]:
+        """Parse a PDF once and return both the flat text and the per-page breakdown.
+
+        Use this instead of calling parse_document() followed by parse_pdf_by_pages(),
+        which reads and parses the same PDF twice.
+
+        Args:
+            file_bytes: PDF file content as bytes
+
+        Returns:
+            Dictionary with all parse_pdf_by_pages() fields plus 'type', 'text',
+            'char_count' and 'word_count'
+        """
+        pdf_result = DocumentParser.parse_pdf_by_pages(file_bytes)
+        text = "\n\n".join(pdf_result['page_texts'])
+
+        return {
+            **pdf_result,
+            'type': 'pdf',
+            'text': text,
+            'char_count': len(text),
+            'word_count': len(text.split())
+        }
+
+    @staticmethod
+    def is_pdf(filename: str, content_type: str = None) -> bool:
+        """Check whether a file is a PDF based on its filename or MIME type.
+
+        Args:
+            filename: Original filename
+            content_type: MIME type of the file
+
+        Returns:
+            True if the file should be parsed as a PDF
+        """
+        return filename.lower().endswith('.pdf') or content_type == 'application/pdf'
+
     @staticmethod
     def parse_docx(file_bytes: bytes) -> str:
         """Extract text from DOCX file.
@@ -420,7 +458,7 @@ class DocumentParser:
         filename_lower = filename.lower()
 
         # Determine file type and parse accordingly
-        if filename_lower.endswith('.pdf') or content_type == 'application/pdf':
+        if cls.is_pdf(filename, content_type):
             text = cls.parse_pdf(file_bytes)
             doc_type = 'pdf'
         elif filename_lower.endswith('.docx') or content_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
@@ -17,12 +17,15 @@ from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
+import asyncio
 import json
+import time
 from datetime import datetime
 
 from agent import TemporalRAGAgent
 from document_parser import DocumentParser
 from text_chunker import TextChunker
+from vector_search_manager import SAFE_ID_TABLE
 
 # Get logger for this module
 logger = get_logger(__name__)
@@ -140,6 +143,22 @@ async def get_index_info():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/index/deployment")
+async def wait_for_index_deployment():
+    """Wait for the index deployment started by /index/create to finish.
+
+    Returns:
+        Deployment status and deployed index IDs
+    """
+    try:
+        result = await agent.vector_search_manager.wait_for_deployment()
+        return {"success": True, "data": result}
+
+    except Exception as e:
+        logger.error(f"Error waiting for index deployment: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/index/clear")
 async def clear_index_datapoints():
     """Clear all datapoints from the index without deleting the index/endpoint.
@@ -233,7 +252,8 @@ async def upload_document(
         content = await file.read()
 
         # Store original file in GCS and get authenticated URL
-        original_file_url = agent.vector_search_manager.store_original_file(
+        original_file_url = await asyncio.to_thread(
+            agent.vector_search_manager.store_original_file,
             file_content=content,
             filename=file.filename,
             content_type=file.content_type or 'application/octet-stream'
@@ -279,10 +299,10 @@ async def upload_document(
         logger.info(f"Using chunk_size={chunk_size}, chunk_overlap={chunk_overlap}")
         chunker = TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
 
-        document_id = f"{file.filename.replace('.', '_').replace(' ', '_')}_{int(datetime.now().timestamp())}"
+        document_id = f"{file.filename.translate(SAFE_ID_TABLE)}_{time.time_ns() // 1_000_000_000}"
 
         # Handle PDF files with page-aware chunking
-        if file.filename.lower().endswith('.pdf') or file.content_type == 'application/pdf':
+        if DocumentParser.is_pdf(file.filename, file.content_type):
             logger.info("Processing PDF (text-only)...")
 
             # Parse PDF text by pages
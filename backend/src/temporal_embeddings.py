@@ -6,16 +6,459 @@ It extracts date information from documents and enhances the embedding process
 to maintain temporal awareness.
 """
 
+from array import array
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+import hashlib
+from typing import Dict, List, Optional, Any, Tuple
 import re
-import asyncio
 import time
-from google import genai
+from dateutil import parser as date_parser
 from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Temporal entity patterns in extraction order (earlier patterns win on identical spans),
+# compiled once since every chunk and query is scanned with all of them
+_TEMPORAL_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), entity_type) for pattern, entity_type in (
+    # Date formats
+    (r'\b\d{4}-\d{2}-\d{2}\b', 'date'),  # YYYY-MM-DD
+    (r'\b\d{1,2}/\d{1,2}/\d{4}\b', 'date'),  # M/D/YYYY or MM/DD/YYYY
+    # Full month names with optional ordinals (st, nd, rd, th) and flexible separators (comma, period, space)
+    (r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?[,.\s]+\d{4}\b', 'date'),
+    # Abbreviated month names (Jan, Feb, etc.) with optional ordinals and flexible separators
+    (r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{1,2}(?:st|nd|rd|th)?[,.\s]+\d{4}\b', 'date'),
+    # Day first format (7 January 2025, 7th of January 2025)
+    (r'\b\d{1,2}(?:st|nd|rd|th)?\s+(?:of\s+)?(?:January|February|March|April|May|June|July|August|September|October|November|December)[,.\s]+\d{4}\b', 'date'),
+
+    # Fiscal and quarter patterns
+    (r'\bQ[1-4]\s+(?:FY\s+)?(?:\d{4}|\d{2})\b', 'fiscal_quarter'),  # Q1 2023, Q1 FY23
+    (r'\b(?:FY|Fiscal\s+Year)\s+(?:\d{4}|\d{2})\b', 'fiscal_year'),  # FY2023, Fiscal Year 23
+    (r'\b(?:first|second|third|fourth)\s+quarter\s+(?:of\s+)?\d{4}\b', 'fiscal_quarter'),  # first quarter of 2023
+    (r'\bH[1-2]\s+\d{4}\b', 'fiscal_half'),  # H1 2023 (half year)
+
+    # Relative date patterns
+    (r'\b(?:last|previous|past)\s+(?:year|quarter|month|week)\b', 'relative_date'),
+    (r'\b(?:this|current)\s+(?:year|quarter|month|week)\b', 'relative_date'),
+    (r'\b(?:next|coming|upcoming)\s+(?:year|quarter|month|week)\b', 'relative_date'),
+    (r'\b\d+\s+(?:years|quarters|months|weeks|days)\s+ago\b', 'relative_date'),
+
+    # Year patterns
+    (r'\b(?:19|20)\d{2}\b', 'year'),
+
+    # Month-Year patterns
+    (r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b', 'month_year'),
+))
+
+# Every temporal pattern except the worded relative dates ("last quarter") requires a
+# digit, so text without digits only needs to be scanned with these patterns
+_DIGIT_FREE_PATTERNS = frozenset(
+    pattern for pattern, _ in _TEMPORAL_PATTERNS if r'\d' not in pattern.pattern
+)
+_DIGIT_PATTERN = re.compile(r'\d')
+
+# A [TABLE N] ... [END TABLE] block, used to attach table context to entities
+_TABLE_BLOCK_PATTERN = re.compile(r'\[TABLE\s+\d+\](.*?)\[END TABLE\]', re.DOTALL)
+
+# Maximum temporal context prefix length (in characters)
+_MAX_PREFIX_LENGTH = 200
+
+# Embedding request limits: the API accepts up to 250 texts and 20k tokens per call.
+# Batches are packed by character count (~4 chars per token) with headroom, so a
+# rate-limited request carries dozens of chunks instead of a handful
+_MAX_BATCH_TEXTS = 250
+_MAX_BATCH_CHARS = 40_000
+
+# Embeddings kept in memory, keyed by a digest of the enhanced text. Re-imports and
+# retries of the same content and repeated queries skip the rate-limited API call.
+# Vectors are stored as packed doubles (~6 KB each for 768 dimensions)
+_EMBEDDING_CACHE_SIZE = 2048
+
+
+# Filename date patterns, compiled once and tried in order within each priority level
+_FILENAME_FULL_DATE_PATTERNS = (
+    re.compile(r'(\d{4})[_\-](\d{2})[_\-](\d{2})'),  # 2023-12-31, 2023_12_31
+    re.compile(r'(?<!\d)(\d{4})(\d{2})(\d{2})(?!\d)'),  # 20231231 (not part of longer number)
+    re.compile(r'(\d{2})[_\-](\d{2})[_\-](\d{4})'),  # 12-31-2023, 12_31_2023
+)
+_FILENAME_QUARTER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Q([1-4])[_\-\s]*(?:FY[_\-\s]*)?(\d{4})',  # Q1_2023, Q1-2023, Q1 FY 2023, Q12023
+    r'Q([1-4])[_\-\s]*(?:FY)?(\d{2})',          # Q1_FY23, Q1-23, Q123
+    r'(\d{4})[_\-\s]*Q([1-4])',                  # 2023Q1, 2023_Q1, 2023-Q1
+    r'(first|second|third|fourth)[_\-\s]+quarter[_\-\s]*(\d{4})',  # first_quarter_2023
+))
+_FILENAME_MONTH_YEAR_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)[_\-\s]*(\d{4})',  # January_2023, January2023
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[_\-\s]*(\d{4})',  # Jan2023, Jan_2023
+    r'(\d{4})[_\-](\d{2})(?!\d)',  # 2023-01, 2023_01 (not part of full date)
+))
+_FILENAME_YEAR_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:FY|Fiscal[_\-\s]*Year)[_\-\s]*(\d{4})',  # FY2023, Fiscal_Year_2023, FY_2023
+    r'(?:FY)[_\-\s]*(\d{2})(?!\d)',                # FY23, FY_23
+    r'(?<!\d)(19|20)(\d{2})(?!\d)',                # 2023 (standalone year, not part of date)
+))
+
+# Month names and abbreviations (lowercase) mapped to zero-padded month numbers
+_MONTH_NUMBERS = {
+    'january': '01', 'jan': '01',
+    'february': '02', 'feb': '02',
+    'march': '03', 'mar': '03',
+    'april': '04', 'apr': '04',
+    'may': '05',
+    'june': '06', 'jun': '06',
+    'july': '07', 'jul': '07',
+    'august': '08', 'aug': '08',
+    'september': '09', 'sep': '09', 'sept': '09',
+    'october': '10', 'oct': '10',
+    'november': '11', 'nov': '11',
+    'december': '12', 'dec': '12'
+}
+
+# Filename date patterns capture the month as a whole word and resolve it through
+# _MONTH_NUMBERS, instead of matching a month-name alternation in the regex
+_MONTH_DAY_YEAR_PATTERN = re.compile(
+    r'(?<![A-Za-z])([A-Za-z]+)\.?[_\-\s,]+(\d{1,2})(?:st|nd|rd|th)?[,\s.]+(\d{4})',
+    re.IGNORECASE
+)
+_DAY_MONTH_YEAR_PATTERN = re.compile(
+    r'(?<![A-Za-z\d])(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?([A-Za-z]+)[,\s.]+(\d{4})',
+    re.IGNORECASE
+)
+
+# Cleanup applied before handing a date string to dateutil: ordinal suffixes that
+# follow a day number ("1st," -> "1,") and periods before a year ("7.2025" -> "7 2025")
+_ORDINAL_SUFFIX_PATTERN = re.compile(r'(\d+)(st|nd|rd|th)([,.\s])')
+_PERIOD_BEFORE_YEAR_PATTERN = re.compile(r'\.(\d{4})')
+
+# Days per month (keyed like _MONTH_NUMBERS values) for a non-leap year
+_DAYS_IN_MONTH = {
+    '01': 31, '02': 28, '03': 31, '04': 30, '05': 31, '06': 30,
+    '07': 31, '08': 31, '09': 30, '10': 31, '11': 30, '12': 31
+}
+
+# A complete "Month D, YYYY" date string ("Aug 27, 2024", "June 04th.2024"), used by
+# _normalize_date before falling back to dateutil
+_MONTH_DAY_YEAR_DATE_PATTERN = re.compile(
+    r'([A-Za-z]+)\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:[,.]\s*|\s+)(\d{4})',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _extract_date_from_filename(filename: str) -> Optional[str]:
+    """Cached implementation of TemporalEmbeddingHandler.extract_date_from_filename.
+
+    Filenames are re-extracted whenever a document is re-ingested, so results are
+    memoized. The lookup depends only on the filename, never on handler state.
+    """
+    if not filename:
+        return None
+
+    # Remove file extension for cleaner matching
+    name_without_ext = filename.rpartition('.')[0] if '.' in filename else filename
+
+    # Every filename date pattern needs a digit, so dateless names ("report.pdf")
+    # are rejected with a single scan
+    if not _DIGIT_PATTERN.search(name_without_ext):
+        return None
+
+    # Patterns are tried in priority order (full_date > quarter > month_year > year)
+    # and the first valid match is returned
+
+    # 1. Full date patterns (highest priority)
+    for pattern in _FILENAME_FULL_DATE_PATTERNS:
+        match = pattern.search(name_without_ext)
+        if match:
+            groups = match.groups()
+            # Try to normalize to YYYY-MM-DD
+            if len(groups[0]) == 4:  # Year first (YYYY-MM-DD, YYYY_MM_DD, YYYYMMDD)
+                year, month, day = groups[0], groups[1], groups[2]
+            else:  # Year last (MM-DD-YYYY, DD-MM-YYYY)
+                # Assume MM-DD-YYYY for US format
+                month, day, year = groups[0], groups[1], groups[2]
+
+            # Basic validation
+            try:
+                year_int = int(year)
+                month_int = int(month)
+                day_int = int(day)
+                if 1900 <= year_int <= 2100 and 1 <= month_int <= 12 and 1 <= day_int <= 31:
+                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+            except ValueError:
+                continue
+
+    # Try month name + day + year format (e.g., "January 07, 2025", "JANUARY 28TH,2025",
+    # "July 1st. 2025", "Aug 27, 2024")
+    for match in _MONTH_DAY_YEAR_PATTERN.finditer(name_without_ext):
+        month = _MONTH_NUMBERS.get(match.group(1).lower())
+        if month is None:
+            continue
+        day, year = match.group(2), match.group(3)
+        if 1900 <= int(year) <= 2100 and 1 <= int(day) <= 31:
+            return f"{year}-{month}-{day.zfill(2)}"
+
+    # Try day-first format (e.g., "1st of November, 2024", "7th of January, 2025")
+    for match in _DAY_MONTH_YEAR_PATTERN.finditer(name_without_ext):
+        month = _MONTH_NUMBERS.get(match.group(2).lower())
+        if month is None:
+            continue
+        day, year = match.group(1), match.group(3)
+        if 1900 <= int(year) <= 2100 and 1 <= int(day) <= 31:
+            return f"{year}-{month}-{day.zfill(2)}"
+
+    # 2. Fiscal quarter patterns
+    for pattern in _FILENAME_QUARTER_PATTERNS:
+        match = pattern.search(name_without_ext)
+        if match:
+            groups = match.groups()
+            # Parse quarter and year
+            if groups[0].isdigit() and len(groups[0]) == 4:  # Year first format (2023Q1)
+                year = groups[0]
+                quarter = groups[1]
+            elif groups[0].lower() in ['first', 'second', 'third', 'fourth']:  # Word format
+                quarter_map = {'first': '1', 'second': '2', 'third': '3', 'fourth': '4'}
+                quarter = quarter_map[groups[0].lower()]
+                year = groups[1]
+            else:  # Quarter first format (Q1_2023)
+                quarter = groups[0]
+                year = groups[1]
+                # Handle 2-digit year
+                if len(year) == 2:
+                    year = f"20{year}"
+
+            # Return as Q1 2023 format
+            return f"Q{quarter} {year}"
+
+    # 3. Month-Year patterns
+    for pattern in _FILENAME_MONTH_YEAR_PATTERNS:
+        match = pattern.search(name_without_ext)
+        if match:
+            groups = match.groups()
+            # Parse month and year
+            if groups[0].isalpha():  # Month name format
+                month = _MONTH_NUMBERS.get(groups[0].lower(), '01')
+                year = groups[1]
+                return f"{year}-{month}"
+            elif len(groups[0]) == 4:  # Year first format (2023-01)
+                year = groups[0]
+                month = groups[1].zfill(2)
+                # Validate month
+                if 1 <= int(month) <= 12:
+                    return f"{year}-{month}"
+            break
+
+    # 4. Year patterns (lowest priority)
+    for pattern in _FILENAME_YEAR_PATTERNS:
+        match = pattern.search(name_without_ext)
+        if match:
+            groups = match.groups()
+            if len(groups) == 1:  # Full year (2023, FY2023)
+                year = groups[0]
+                if len(year) == 2:  # Handle FY23
+                    year = f"20{year}"
+            else:  # Two-digit year split (19|20)(\d{2})
+                year = groups[0] + groups[1]
+
+            # Validate year range
+            try:
+                year_int = int(year)
+                if 1900 <= year_int <= 2100:
+                    return year
+            except ValueError:
+                continue
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _normalize_date_string(date_string: str) -> Optional[str]:
+    """Cached implementation of TemporalEmbeddingHandler._normalize_date.
+
+    The same date strings ("August 2024", "Q4 2024") recur across imported files,
+    and normalization depends only on the input string.
+    """
+    if not date_string:
+        return None
+
+    # Already YYYY-MM-DD: returned unchanged by both the parser and the fallback below
+    if (len(date_string) == 10 and date_string[4] == '-' and date_string[7] == '-'
+            and date_string[:4].isdecimal() and date_string[5:7].isdecimal()
+            and date_string[8:].isdecimal()):
+        return date_string
+
+    # ISO date-times (2024-06-10T12:00:00Z) parse natively; week dates (2024-W01)
+    # are excluded since dateutil rejects them
+    if date_string[:4].isdecimal() and date_string[4:5] == '-' and date_string[7:8] == '-':
+        try:
+            parsed = datetime.fromisoformat(date_string)
+            return f"{parsed.year}-{parsed.month:02d}-{parsed.day:02d}"
+        except ValueError:
+            pass
+
+    # "Month D, YYYY" and its variants resolve without dateutil (zero-led years
+    # such as 0099 are left to dateutil, which reads them as two-digit years)
+    match = _MONTH_DAY_YEAR_DATE_PATTERN.fullmatch(date_string)
+    if match and match.group(3)[0] != '0':
+        month = _MONTH_NUMBERS.get(match.group(1).lower())
+        if month:
+            year, day = int(match.group(3)), int(match.group(2))
+            days_in_month = _DAYS_IN_MONTH[month]
+            if month == '02' and (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+                days_in_month = 29
+            # Impossible dates (e.g. February 30) are left to dateutil
+            if 1 <= day <= days_in_month:
+                return f"{year}-{month}-{day:02d}"
+
+    try:
+        # Try dateutil parser for flexible parsing
+        # Remove ordinal suffixes (st, nd, rd, th) ONLY when they follow digits
+        # This prevents removing "st" from "August" or "nd" from other words
+        cleaned = date_string
+
+        # Remove ordinals after digits: 1st, 2nd, 3rd, 21st, 22nd, 23rd, 31st, etc.
+        cleaned = _ORDINAL_SUFFIX_PATTERN.sub(r'\1\3', cleaned)
+
+        # Replace periods with spaces when they separate date components (but not in abbreviated months like "Jan.")
+        # This handles cases like "January 7.2025" -> "January 7 2025"
+        cleaned = _PERIOD_BEFORE_YEAR_PATTERN.sub(r' \1', cleaned)
+
+        # Parse the date
+        parsed_date = date_parser.parse(cleaned, fuzzy=False)
+
+        # Return in YYYY-MM-DD format
+        normalized = f"{parsed_date.year}-{parsed_date.month:02d}-{parsed_date.day:02d}"
+
+        logger.debug(
+            "Normalized date",
+            extra={
+                'original': date_string,
+                'normalized': normalized
+            }
+        )
+
+        return normalized
+
+    except Exception as e:
+        # If parsing fails, check if it's already in YYYY-MM-DD format
+        if re.match(r'^\d{4}-\d{2}-\d{2}$', date_string):
+            return date_string
+
+        logger.debug(
+            "Could not normalize date",
+            extra={
+                'date_string': date_string,
+                'error': str(e)
+            }
+        )
+        return None
+
+
+def _extract_table_context(text: str, position: tuple) -> Optional[str]:
+    """Implementation of TemporalEmbeddingHandler._extract_table_context.
+
+    Kept at module level so the cached entity extraction below can use it.
+    """
+    try:
+        # Check if position is inside a table
+        for table_match in _TABLE_BLOCK_PATTERN.finditer(text):
+            if table_match.start() <= position[0] <= table_match.end():
+                # Entity is inside this table
+                table_text = table_match.group(1)
+
+                # Handle empty or malformed tables
+                if not table_text or not table_text.strip():
+                    return "[Table Data]"
+
+                # Try to extract column header context
+                lines = table_text.split('\n')
+                if len(lines) >= 2:
+                    # First line is likely the header
+                    header_line = lines[0]
+                    # Extract column headers
+                    headers = [h.strip() for h in header_line.split('|') if h.strip()]
+
+                    # Calculate entity's position within the table text
+                    entity_text = text[position[0]:position[1]]
+                    entity_pos_in_table = position[0] - table_match.start()
+
+                    # Find the row containing the entity using position
+                    char_count = 0
+                    for line in lines:
+                        # Skip markdown separator line (contains only dashes and pipes)
+                        if line.strip() and all(c in '-| ' for c in line.strip()):
+                            char_count += len(line) + 1  # +1 for newline
+                            continue
+
+                        line_start = char_count
+                        line_end = char_count + len(line)
+
+                        # Check if entity is in this line by position
+                        if line_start <= entity_pos_in_table < line_end:
+                            # Entity is in this line - find which column
+                            # Calculate position within line
+                            pos_in_line = entity_pos_in_table - line_start
+
+                            # Split by pipes and track positions
+                            cells = line.split('|')
+                            cell_start = 0
+                            for i, cell in enumerate(cells):
+                                cell_end = cell_start + len(cell)
+                                # Check if entity position is in this cell
+                                if cell_start <= pos_in_line < cell_end:
+                                    # Found the cell! Map to header
+                                    # Adjust index (skip empty leading cell from split)
+                                    cell_index = i - 1 if cells[0].strip() == '' else i
+                                    if 0 <= cell_index < len(headers):
+                                        return f"[Table Column: {headers[cell_index]}]"
+                                cell_start = cell_end + 1  # +1 for pipe
+
+                            # If we got here, return generic table data
+                            return "[Table Data]"
+
+                        char_count += len(line) + 1  # +1 for newline
+
+                return "[Table Data]"
+
+        return None
+
+    except Exception as e:
+        logger.warning(
+            "Error extracting table context",
+            exc_info=True,
+            extra={'position': position}
+        )
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _extract_temporal_entities(text: str) -> Tuple[Tuple[str, str, Tuple[int, int], Optional[str]], ...]:
+    """Cached implementation of TemporalEmbeddingHandler.extract_temporal_info.
+
+    Query phrases ("Q3 2024 revenue", "last quarter") repeat across searches, and
+    extraction depends only on the text. Entities are stored as
+    (type, value, position, context) tuples so cached results stay immutable.
+    """
+    temporal_entities = []
+    seen_positions = set()
+    has_digits = _DIGIT_PATTERN.search(text) is not None
+
+    for pattern, entity_type in _TEMPORAL_PATTERNS:
+        if not has_digits and pattern not in _DIGIT_FREE_PATTERNS:
+            continue
+
+        for match in pattern.finditer(text):
+            # Skip duplicates (same position matched by an earlier pattern)
+            pos = match.span()
+            if pos in seen_positions:
+                continue
+            seen_positions.add(pos)
+
+            # Extract table context if applicable
+            temporal_entities.append((entity_type, match.group(), pos, _extract_table_context(text, pos)))
+
+    return tuple(temporal_entities)
+
 
 class TemporalEmbeddingHandler:
     """Handles embedding generation with temporal context awareness."""
@@ -48,12 +491,28 @@ class TemporalEmbeddingHandler:
             }
         )
 
-        # Initialize google-genai client with Vertex AI
-        self.client = genai.Client(
-            vertexai=True,
-            project=project_id,
-            location=location
-        )
+        # google-genai client is created on first embedding call (see `client`)
+        self._client = None
+
+        # LRU of embeddings by enhanced-text digest (see _EMBEDDING_CACHE_SIZE)
+        self._embedding_cache: OrderedDict = OrderedDict()
+
+    @property
+    def client(self):
+        """Lazily create the google-genai client with Vertex AI.
+
+        Temporal extraction never touches the SDK, so callers that only need
+        date parsing or text enhancement do not pay for client construction.
+        """
+        if self._client is None:
+            from google import genai
+
+            self._client = genai.Client(
+                vertexai=True,
+                project=self.project_id,
+                location=self.location
+            )
+        return self._client
 
     def _extract_table_context(self, text: str, position: tuple) -> Optional[str]:
         """Extract table context for a temporal entity if it's inside a table.
@@ -65,78 +524,7 @@ class TemporalEmbeddingHandler:
         Returns:
             Table context string or None
         """
-        try:
-            # Check if position is inside a table
-            table_pattern = r'\[TABLE\s+\d+\](.*?)\[END TABLE\]'
-
-            for table_match in re.finditer(table_pattern, text, re.DOTALL):
-                if table_match.start() <= position[0] <= table_match.end():
-                    # Entity is inside this table
-                    table_text = table_match.group(1)
-
-                    # Handle empty or malformed tables
-                    if not table_text or not table_text.strip():
-                        return "[Table Data]"
-
-                    # Try to extract column header context
-                    lines = table_text.split('\n')
-                    if len(lines) >= 2:
-                        # First line is likely the header
-                        header_line = lines[0]
-                        # Extract column headers
-                        headers = [h.strip() for h in header_line.split('|') if h.strip()]
-
-                        # Calculate entity's position within the table text
-                        entity_text = text[position[0]:position[1]]
-                        entity_pos_in_table = position[0] - table_match.start()
-
-                        # Find the row containing the entity using position
-                        char_count = 0
-                        for line in lines:
-                            # Skip markdown separator line (contains only dashes and pipes)
-                            if line.strip() and all(c in '-| ' for c in line.strip()):
-                                char_count += len(line) + 1  # +1 for newline
-                                continue
-
-                            line_start = char_count
-                            line_end = char_count + len(line)
-
-                            # Check if entity is in this line by position
-                            if line_start <= entity_pos_in_table < line_end:
-                                # Entity is in this line - find which column
-                                # Calculate position within line
-                                pos_in_line = entity_pos_in_table - line_start
-
-                                # Split by pipes and track positions
-                                cells = line.split('|')
-                                cell_start = 0
-                                for i, cell in enumerate(cells):
-                                    cell_end = cell_start + len(cell)
-                                    # Check if entity position is in this cell
-                                    if cell_start <= pos_in_line < cell_end:
-                                        # Found the cell! Map to header
-                                        # Adjust index (skip empty leading cell from split)
-                                        cell_index = i - 1 if cells[0].strip() == '' else i
-                                        if 0 <= cell_index < len(headers):
-                                            return f"[Table Column: {headers[cell_index]}]"
-                                    cell_start = cell_end + 1  # +1 for pipe
-
-                                # If we got here, return generic table data
-                                return "[Table Data]"
-
-                            char_count += len(line) + 1  # +1 for newline
-
-                    return "[Table Data]"
-
-            return None
-
-        except Exception as e:
-            logger.warning(
-                "Error extracting table context",
-                exc_info=True,
-                extra={'position': position}
-            )
-            return None
+        return _extract_table_context(text, position)
 
     def extract_temporal_info(self, text: str) -> List[Dict[str, Any]]:
         """Extract temporal information from text including fiscal periods and quarters with table awareness.
@@ -147,69 +535,12 @@ class TemporalEmbeddingHandler:
         Returns:
             List of temporal entities found in the text with table context
         """
-        temporal_entities = []
-
-        # Pattern for various date formats
-        date_patterns = [
-            (r'\b\d{4}-\d{2}-\d{2}\b', 'date'),  # YYYY-MM-DD
-            (r'\b\d{1,2}/\d{1,2}/\d{4}\b', 'date'),  # M/D/YYYY or MM/DD/YYYY
-            # Full month names with optional ordinals (st, nd, rd, th) and flexible separators (comma, period, space)
-            (r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?[,.\s]+\d{4}\b', 'date'),
-            # Abbreviated month names (Jan, Feb, etc.) with optional ordinals and flexible separators
-            (r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{1,2}(?:st|nd|rd|th)?[,.\s]+\d{4}\b', 'date'),
-            # Day first format (7 January 2025, 7th of January 2025)
-            (r'\b\d{1,2}(?:st|nd|rd|th)?\s+(?:of\s+)?(?:January|February|March|April|May|June|July|August|September|October|November|December)[,.\s]+\d{4}\b', 'date'),
+        # Fresh dicts per call so callers can't mutate the cached entities
+        return [
+            {'type': entity_type, 'value': value, 'position': position, 'context': context}
+            for entity_type, value, position, context in _extract_temporal_entities(text)
         ]
 
-        # Fiscal and quarter patterns
-        fiscal_patterns = [
-            (r'\bQ[1-4]\s+(?:FY\s+)?(?:\d{4}|\d{2})\b', 'fiscal_quarter'),  # Q1 2023, Q1 FY23
-            (r'\b(?:FY|Fiscal\s+Year)\s+(?:\d{4}|\d{2})\b', 'fiscal_year'),  # FY2023, Fiscal Year 23
-            (r'\b(?:first|second|third|fourth)\s+quarter\s+(?:of\s+)?\d{4}\b', 'fiscal_quarter'),  # first quarter of 2023
-            (r'\bH[1-2]\s+\d{4}\b', 'fiscal_half'),  # H1 2023 (half year)
-        ]
-
-        # Relative date patterns
-        relative_patterns = [
-            (r'\b(?:last|previous|past)\s+(?:year|quarter|month|week)\b', 'relative_date'),
-            (r'\b(?:this|current)\s+(?:year|quarter|month|week)\b', 'relative_date'),
-            (r'\b(?:next|coming|upcoming)\s+(?:year|quarter|month|week)\b', 'relative_date'),
-            (r'\b\d+\s+(?:years|quarters|months|weeks|days)\s+ago\b', 'relative_date'),
-        ]
-
-        # Year patterns
-        year_pattern = [(r'\b(?:19|20)\d{2}\b', 'year')]
-
-        # Month-Year patterns
-        month_year_pattern = [(r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b', 'month_year')]
-
-        # Combine all patterns
-        all_patterns = date_patterns + fiscal_patterns + relative_patterns + year_pattern + month_year_pattern
-
-        for pattern, entity_type in all_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Extract table context if applicable
-                table_context = self._extract_table_context(text, match.span())
-
-                temporal_entities.append({
-                    'type': entity_type,
-                    'value': match.group(),
-                    'position': match.span(),
-                    'context': table_context  # New: table context
-                })
-
-        # Remove duplicates (same position)
-        seen_positions = set()
-        unique_entities = []
-        for entity in temporal_entities:
-            pos = entity['position']
-            if pos not in seen_positions:
-                seen_positions.add(pos)
-                unique_entities.append(entity)
-
-        return unique_entities
-
     def extract_date_from_filename(self, filename: str) -> Optional[str]:
         """Extract temporal information from filename.
 
@@ -225,235 +556,7 @@ class TemporalEmbeddingHandler:
             3. Month-Year (January 2023, 2023-01)
             4. Year only (2023, FY2023)
         """
-        if not filename:
-            return None
-
-        # Remove file extension for cleaner matching
-        name_without_ext = filename.rsplit('.', 1)[0] if '.' in filename else filename
-
-        # Dictionary to track best match (priority: full_date > quarter > month_year > year)
-        matches = {
-            'full_date': None,
-            'quarter': None,
-            'month_year': None,
-            'year': None
-        }
-
-        # 1. Full date patterns (highest priority)
-        full_date_patterns = [
-            r'(\d{4})[_\-](\d{2})[_\-](\d{2})',  # 2023-12-31, 2023_12_31
-            r'(?<!\d)(\d{4})(\d{2})(\d{2})(?!\d)',  # 20231231 (not part of longer number)
-            r'(\d{2})[_\-](\d{2})[_\-](\d{4})',  # 12-31-2023, 12_31_2023
-        ]
-
-        # Check for full date patterns first
-        for pattern in full_date_patterns:
-            match = re.search(pattern, name_without_ext)
-            if match:
-                groups = match.groups()
-                # Try to normalize to YYYY-MM-DD
-                if len(groups[0]) == 4:  # Year first (YYYY-MM-DD, YYYY_MM_DD, YYYYMMDD)
-                    year, month, day = groups[0], groups[1], groups[2]
-                else:  # Year last (MM-DD-YYYY, DD-MM-YYYY)
-                    # Assume MM-DD-YYYY for US format
-                    month, day, year = groups[0], groups[1], groups[2]
-
-                # Basic validation
-                try:
-                    year_int = int(year)
-                    month_int = int(month)
-                    day_int = int(day)
-                    if 1900 <= year_int <= 2100 and 1 <= month_int <= 12 and 1 <= day_int <= 31:
-                        matches['full_date'] = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        break  # Found best match, stop searching
-                except ValueError:
-                    continue
-
-        # Try month name + day + year format (e.g., "January 07, 2025", "JANUARY 28TH,2025", "July 1st. 2025")
-        if not matches['full_date']:
-            month_day_year_pattern = r'(January|February|March|April|May|June|July|August|September|October|November|December)[_\-\s,]+(\d{1,2})(?:st|nd|rd|th)?[,\s.]+(\d{4})'
-            match = re.search(month_day_year_pattern, name_without_ext, re.IGNORECASE)
-            if match:
-                month_name = match.group(1)
-                day = match.group(2)
-                year = match.group(3)
-
-                # Map month name to number
-                month_map = {
-                    'january': '01', 'february': '02', 'march': '03', 'april': '04',
-                    'may': '05', 'june': '06', 'july': '07', 'august': '08',
-                    'september': '09', 'october': '10', 'november': '11', 'december': '12'
-                }
-                month = month_map.get(month_name.lower(), '01')
-
-                # Validate
-                try:
-                    year_int = int(year)
-                    day_int = int(day)
-                    if 1900 <= year_int <= 2100 and 1 <= day_int <= 31:
-                        matches['full_date'] = f"{year}-{month}-{day.zfill(2)}"
-                except ValueError:
-                    pass
-
-        # Try abbreviated month name + day + year format (e.g., "Aug 27, 2024", "Jan 7, 2025")
-        if not matches['full_date']:
-            abbr_month_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\.?\s+(\d{1,2})(?:st|nd|rd|th)?[,\s.]+(\d{4})'
-            match = re.search(abbr_month_pattern, name_without_ext, re.IGNORECASE)
-            if match:
-                abbr_month = match.group(1)
-                day = match.group(2)
-                year = match.group(3)
-
-                # Map abbreviated month to number
-                abbr_map = {
-                    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-                    'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-                    'sep': '09', 'sept': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-                }
-                month = abbr_map.get(abbr_month.lower(), '01')
-
-                # Validate
-                try:
-                    year_int = int(year)
-                    day_int = int(day)
-                    if 1900 <= year_int <= 2100 and 1 <= day_int <= 31:
-                        matches['full_date'] = f"{year}-{month}-{day.zfill(2)}"
-                except ValueError:
-                    pass
-
-        # Try day-first format (e.g., "1st of November, 2024", "7th of January, 2025")
-        if not matches['full_date']:
-            day_first_pattern = r'(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?(January|February|March|April|May|June|July|August|September|October|November|December)[,\s.]+(\d{4})'
-            match = re.search(day_first_pattern, name_without_ext, re.IGNORECASE)
-            if match:
-                day = match.group(1)
-                month_name = match.group(2)
-                year = match.group(3)
-
-                # Map month name to number
-                month_map = {
-                    'january': '01', 'february': '02', 'march': '03', 'april': '04',
-                    'may': '05', 'june': '06', 'july': '07', 'august': '08',
-                    'september': '09', 'october': '10', 'november': '11', 'december': '12'
-                }
-                month = month_map.get(month_name.lower(), '01')
-
-                # Validate
-                try:
-                    year_int = int(year)
-                    day_int = int(day)
-                    if 1900 <= year_int <= 2100 and 1 <= day_int <= 31:
-                        matches['full_date'] = f"{year}-{month}-{day.zfill(2)}"
-                except ValueError:
-                    pass
-
-        # 2. Fiscal quarter patterns
-        quarter_patterns = [
-            r'Q([1-4])[_\-\s]*(?:FY[_\-\s]*)?(\d{4})',  # Q1_2023, Q1-2023, Q1 FY 2023, Q12023
-            r'Q([1-4])[_\-\s]*(?:FY)?(\d{2})',          # Q1_FY23, Q1-23, Q123
-            r'(\d{4})[_\-\s]*Q([1-4])',                  # 2023Q1, 2023_Q1, 2023-Q1
-            r'(first|second|third|fourth)[_\-\s]+quarter[_\-\s]*(\d{4})',  # first_quarter_2023
-        ]
-
-        for pattern in quarter_patterns:
-            match = re.search(pattern, name_without_ext, re.IGNORECASE)
-            if match:
-                groups = match.groups()
-                # Parse quarter and year
-                if groups[0].isdigit() and len(groups[0]) == 4:  # Year first format (2023Q1)
-                    year = groups[0]
-                    quarter = groups[1]
-                elif groups[0].lower() in ['first', 'second', 'third', 'fourth']:  # Word format
-                    quarter_map = {'first': '1', 'second': '2', 'third': '3', 'fourth': '4'}
-                    quarter = quarter_map[groups[0].lower()]
-                    year = groups[1]
-                else:  # Quarter first format (Q1_2023)
-                    quarter = groups[0]
-                    year = groups[1]
-                    # Handle 2-digit year
-                    if len(year) == 2:
-                        year = f"20{year}"
-
-                # Store as Q1 2023 format
-                matches['quarter'] = f"Q{quarter} {year}"
-                break
-
-        # 3. Month-Year patterns
-        month_year_patterns = [
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)[_\-\s]*(\d{4})',  # January_2023, January2023
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[_\-\s]*(\d{4})',  # Jan2023, Jan_2023
-            r'(\d{4})[_\-](\d{2})(?!\d)',  # 2023-01, 2023_01 (not part of full date)
-        ]
-
-        for pattern in month_year_patterns:
-            match = re.search(pattern, name_without_ext, re.IGNORECASE)
-            if match:
-                groups = match.groups()
-                # Parse month and year
-                if groups[0].isalpha():  # Month name format
-                    month_map = {
-                        'january': '01', 'jan': '01',
-                        'february': '02', 'feb': '02',
-                        'march': '03', 'mar': '03',
-                        'april': '04', 'apr': '04',
-                        'may': '05',
-                        'june': '06', 'jun': '06',
-                        'july': '07', 'jul': '07',
-                        'august': '08', 'aug': '08',
-                        'september': '09', 'sep': '09',
-                        'october': '10', 'oct': '10',
-                        'november': '11', 'nov': '11',
-                        'december': '12', 'dec': '12'
-                    }
-                    month = month_map.get(groups[0].lower(), '01')
-                    year = groups[1]
-                    matches['month_year'] = f"{year}-{month}"
-                elif len(groups[0]) == 4:  # Year first format (2023-01)
-                    year = groups[0]
-                    month = groups[1].zfill(2)
-                    # Validate month
-                    if 1 <= int(month) <= 12:
-                        matches['month_year'] = f"{year}-{month}"
-                break
-
-        # 4. Year patterns (lowest priority)
-        year_patterns = [
-            r'(?:FY|Fiscal[_\-\s]*Year)[_\-\s]*(\d{4})',  # FY2023, Fiscal_Year_2023, FY_2023
-            r'(?:FY)[_\-\s]*(\d{2})(?!\d)',                # FY23, FY_23
-            r'(?<!\d)(19|20)(\d{2})(?!\d)',                # 2023 (standalone year, not part of date)
-        ]
-
-        for pattern in year_patterns:
-            match = re.search(pattern, name_without_ext, re.IGNORECASE)
-            if match:
-                groups = match.groups()
-                if len(groups) == 1:  # Full year (2023, FY2023)
-                    year = groups[0]
-                    if len(year) == 2:  # Handle FY23
-                        year = f"20{year}"
-                else:  # Two-digit year split (19|20)(\d{2})
-                    year = groups[0] + groups[1]
-
-                # Validate year range
-                try:
-                    year_int = int(year)
-                    if 1900 <= year_int <= 2100:
-                        matches['year'] = year
-                        break
-                except ValueError:
-                    continue
-
-        # Return best match based on priority
-        if matches['full_date']:
-            return matches['full_date']
-        elif matches['quarter']:
-            return matches['quarter']
-        elif matches['month_year']:
-            return matches['month_year']
-        elif matches['year']:
-            return matches['year']
-
-        return None
+        return _extract_date_from_filename(filename)
 
     def _normalize_date(self, date_string: str) -> Optional[str]:
         """Normalize a date string to YYYY-MM-DD format.
@@ -473,55 +576,7 @@ class TemporalEmbeddingHandler:
         Returns:
             Normalized date in YYYY-MM-DD format, or None if parsing fails
         """
-        if not date_string:
-            return None
-
-        try:
-            # Try dateutil parser for flexible parsing
-            from dateutil import parser as date_parser
-            import re
-
-            # Remove ordinal suffixes (st, nd, rd, th) ONLY when they follow digits
-            # This prevents removing "st" from "August" or "nd" from other words
-            cleaned = date_string
-
-            # Remove ordinals after digits: 1st, 2nd, 3rd, 21st, 22nd, 23rd, 31st, etc.
-            cleaned = re.sub(r'(\d+)(st|nd|rd|th)([,.\s])', r'\1\3', cleaned)
-
-            # Replace periods with spaces when they separate date components (but not in abbreviated months like "Jan.")
-            # This handles cases like "January 7.2025" -> "January 7 2025"
-            cleaned = re.sub(r'\.(\d{4})', r' \1', cleaned)
-
-            # Parse the date
-            parsed_date = date_parser.parse(cleaned, fuzzy=False)
-
-            # Return in YYYY-MM-DD format
-            normalized = parsed_date.strftime('%Y-%m-%d')
-
-            logger.debug(
-                "Normalized date",
-                extra={
-                    'original': date_string,
-                    'normalized': normalized
-                }
-            )
-
-            return normalized
-
-        except Exception as e:
-            # If parsing fails, check if it's already in YYYY-MM-DD format
-            import re
-            if re.match(r'^\d{4}-\d{2}-\d{2}$', date_string):
-                return date_string
-
-            logger.debug(
-                "Could not normalize date",
-                extra={
-                    'date_string': date_string,
-                    'error': str(e)
-                }
-            )
-            return None
+        return _normalize_date_string(date_string)
 
     def enhance_text_with_temporal_context(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Enhance text with comprehensive temporal context markers.
@@ -611,7 +666,7 @@ class TemporalEmbeddingHandler:
             prefix = f"[TEMPORAL_CONTEXT: {full_context}]\n"
 
             # Limit prefix length to reasonable size (max 200 chars for prefix)
-            max_prefix_length = 200
+            max_prefix_length = _MAX_PREFIX_LENGTH
             if len(prefix) > max_prefix_length:
                 # Truncate and add indicator
                 truncated_context = full_context[:max_prefix_length - 50]  # Leave room for markers
@@ -711,6 +766,38 @@ class TemporalEmbeddingHandler:
                     logger.error("Embedding API error", exc_info=True)
                     raise
 
+    @staticmethod
+    def _embedding_cache_key(enhanced_text: str) -> bytes:
+        """Digest identifying an enhanced text in the embedding cache."""
+        return hashlib.blake2b(enhanced_text.encode('utf-8'), digest_size=16).digest()
+
+    def _get_cached_embedding(self, key: bytes) -> Optional[List[float]]:
+        """Return a cached embedding and mark it as recently used.
+
+        Args:
+            key: Cache key from _embedding_cache_key
+
+        Returns:
+            Embedding vector, or None if not cached
+        """
+        values = self._embedding_cache.get(key)
+        if values is None:
+            return None
+        self._embedding_cache.move_to_end(key)
+        return values.tolist()
+
+    def _cache_embedding(self, key: bytes, values: List[float]):
+        """Store an embedding, evicting the least recently used one when full.
+
+        Args:
+            key: Cache key from _embedding_cache_key
+            values: Embedding vector
+        """
+        self._embedding_cache[key] = array('d', values)
+        self._embedding_cache.move_to_end(key)
+        if len(self._embedding_cache) > _EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+
     def generate_embedding(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> List[float]:
         """Generate embedding with temporal context.
 
@@ -724,11 +811,18 @@ class TemporalEmbeddingHandler:
         # Enhance text with temporal context
         enhanced_text = self.enhance_text_with_temporal_context(text, metadata)
 
+        cache_key = self._embedding_cache_key(enhanced_text)
+        cached = self._get_cached_embedding(cache_key)
+        if cached is not None:
+            return cached
+
         # Generate embedding using rate-limited API call
         response = self._call_embed_api_with_retry(contents=[enhanced_text])
 
         # Extract embedding values from response
-        return response.embeddings[0].values
+        values = response.embeddings[0].values
+        self._cache_embedding(cache_key, values)
+        return values
 
     def generate_batch_embeddings(
         self,
@@ -753,24 +847,38 @@ class TemporalEmbeddingHandler:
             for text, metadata in zip(texts, metadata_list)
         ]
 
-        # Generate embeddings in batches (API limit is typically 5-250)
-        batch_size = 5
-        all_embeddings = []
-
-        total_batches = (len(enhanced_texts) + batch_size - 1) // batch_size
+        # Serve previously embedded texts from the cache; only misses hit the API
+        cache_keys = [self._embedding_cache_key(text) for text in enhanced_texts]
+        all_embeddings = [self._get_cached_embedding(key) for key in cache_keys]
+        missing = [i for i, embedding in enumerate(all_embeddings) if embedding is None]
+
+        # Pack missing texts into as few requests as the per-call text and size limits allow
+        batches = []
+        batch_start = 0
+        batch_chars = 0
+        for n, i in enumerate(missing):
+            text_length = len(enhanced_texts[i])
+            if n > batch_start and (n - batch_start >= _MAX_BATCH_TEXTS or batch_chars + text_length > _MAX_BATCH_CHARS):
+                batches.append(missing[batch_start:n])
+                batch_start = n
+                batch_chars = 0
+            batch_chars += text_length
+        if batch_start < len(missing):
+            batches.append(missing[batch_start:])
+
+        total_batches = len(batches)
         logger.info(
             "Starting batch embedding generation",
             extra={
                 'total_texts': len(enhanced_texts),
-                'batch_size': batch_size,
+                'cached_texts': len(enhanced_texts) - len(missing),
+                'max_batch_size': _MAX_BATCH_TEXTS,
                 'total_batches': total_batches
             }
         )
 
-        for i in range(0, len(enhanced_texts), batch_size):
-            batch = enhanced_texts[i:i + batch_size]
-            batch_num = (i // batch_size) + 1
-
+        for batch_num, batch_indices in enumerate(batches, 1):
+            batch = [enhanced_texts[i] for i in batch_indices]
             logger.info(
                 "Processing embedding batch",
                 extra={
@@ -784,7 +892,9 @@ class TemporalEmbeddingHandler:
             response = self._call_embed_api_with_retry(contents=batch)
 
             # Extract embedding values from response
-            all_embeddings.extend([emb.values for emb in response.embeddings])
+            for i, emb in zip(batch_indices, response.embeddings):
+                all_embeddings[i] = emb.values
+                self._cache_embedding(cache_keys[i], emb.values)
 
         logger.info(
             "Batch embedding generation completed",
@@ -1,11 +1,31 @@
 """Text chunking utilities for RAG document processing."""
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterator, Tuple
 import re
 from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Default separators in order of preference, shared by every chunker that does
+# not pass its own
+_DEFAULT_SEPARATORS = (
+    "\n## ",      # Markdown H2 headers
+    "\n### ",     # Markdown H3 headers
+    "\n#### ",    # Markdown H4 headers
+    "\n\n\n",     # Multiple newlines (section breaks)
+    "\n\n",       # Double newlines (paragraph breaks)
+    "\n- ",       # List items
+    "\n* ",       # List items
+    "\n",         # Single newlines
+    ". ",         # Sentence endings
+    "! ",
+    "? ",
+    "; ",
+    ", ",
+    " ",          # Word boundaries
+    ""            # Character-level split (last resort)
+)
+
 
 class TextChunker:
     """Split documents into chunks for embedding with semantic awareness."""
@@ -22,29 +42,13 @@ class TextChunker:
         Args:
             chunk_size: Maximum number of characters per chunk
             chunk_overlap: Number of characters to overlap between chunks
-            separators: List of separators to split on (in order of preference)
+            separators: Separators to split on (in order of preference)
             respect_structure: Whether to respect markdown/structural boundaries
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.respect_structure = respect_structure
-        self.separators = separators or [
-            "\n## ",      # Markdown H2 headers
-            "\n### ",     # Markdown H3 headers
-            "\n#### ",    # Markdown H4 headers
-            "\n\n\n",     # Multiple newlines (section breaks)
-            "\n\n",       # Double newlines (paragraph breaks)
-            "\n- ",       # List items
-            "\n* ",       # List items
-            "\n",         # Single newlines
-            ". ",         # Sentence endings
-            "! ",
-            "? ",
-            "; ",
-            ", ",
-            " ",          # Word boundaries
-            ""            # Character-level split (last resort)
-        ]
+        self.separators = tuple(separators) if separators else _DEFAULT_SEPARATORS
 
     def _extract_table_blocks(self, text: str) -> List[Dict[str, Any]]:
         """Extract table blocks from text with their positions.
@@ -55,7 +59,6 @@ class TextChunker:
         Returns:
             List of table block dictionaries with start, end, and content
         """
-        import re
         table_blocks = []
 
         # Find all [TABLE N] ... [END TABLE] blocks
@@ -135,6 +138,10 @@ class TextChunker:
         logger.info(f"Split document into {len(text_chunks)} chunks (chunk_size={self.chunk_size}, overlap={self.chunk_overlap})")
 
         # Create chunk objects with metadata and quality scores
+        total_chunks = len(text_chunks)
+        last_index = total_chunks - 1
+        id_prefix = f"{document_id}_chunk_" if document_id else "chunk_"
+
         for i, chunk_text in enumerate(text_chunks):
             quality = self._get_chunk_quality_score(chunk_text)
 
@@ -143,17 +150,17 @@ class TextChunker:
                 'metadata': {
                     **metadata,
                     'chunk_index': i,
-                    'total_chunks': len(text_chunks),
+                    'total_chunks': total_chunks,
                     'chunk_size': len(chunk_text),
                     'is_first_chunk': i == 0,
-                    'is_last_chunk': i == len(text_chunks) - 1,
+                    'is_last_chunk': i == last_index,
                     'quality_score': quality['quality_score'],
                     'sentence_count': quality['sentence_count'],
                     'word_count': quality['word_count'],
                     'has_table': quality['has_table'],
                     'table_count': quality['table_count'],
                 },
-                'id': f"{document_id}_chunk_{i}" if document_id else f"chunk_{i}"
+                'id': f"{id_prefix}{i}"
             }
             chunks.append(chunk)
 
@@ -242,11 +249,19 @@ class TextChunker:
         Returns:
             List of text chunks
         """
+        # Text that already fits is a single chunk; skip the separator cascade
+        if len(text) <= self.chunk_size:
+            stripped = text.strip()
+            return [stripped] if stripped else []
+
         # Try to split using separators in order
         chunks = [text]
 
         for separator in self.separators:
             new_chunks = []
+            # Only freshly split pieces can still be too large, so track that
+            # here instead of rescanning every chunk after the pass
+            has_oversized = False
 
             for chunk in chunks:
                 if len(chunk) <= self.chunk_size:
@@ -255,11 +270,13 @@ class TextChunker:
                     # Split this chunk further
                     split_chunks = self._split_by_separator(chunk, separator)
                     new_chunks.extend(split_chunks)
+                    if not has_oversized:
+                        has_oversized = any(len(c) > self.chunk_size for c in split_chunks)
 
             chunks = new_chunks
 
             # If all chunks are small enough, we're done
-            if all(len(c) <= self.chunk_size for c in chunks):
+            if not has_oversized:
                 break
 
         # Merge small chunks and handle overlaps
@@ -281,28 +298,39 @@ class TextChunker:
             # Character-level split as last resort
             return [text[i:i+self.chunk_size] for i in range(0, len(text), self.chunk_size - self.chunk_overlap)]
 
-        # Split by separator
-        parts = text.split(separator)
+        # Walk separator positions with find() and track the current chunk as a
+        # [chunk_start, chunk_end) span of text, so only emitted chunks are copied
         chunks = []
-        current_chunk = ""
+        separator_length = len(separator)
+        text_length = len(text)
+        chunk_start = chunk_end = 0
+        pos = 0
+
+        while True:
+            next_separator = text.find(separator, pos)
+            part_end = next_separator if next_separator != -1 else text_length
+            current_length = chunk_end - chunk_start
 
-        for part in parts:
             # If adding this part would exceed chunk size
-            if len(current_chunk) + len(part) + len(separator) > self.chunk_size:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                    current_chunk = part
+            if current_length + (part_end - pos) + separator_length > self.chunk_size:
+                if current_length:
+                    chunks.append(text[chunk_start:chunk_end])
+                    chunk_start, chunk_end = pos, part_end
                 else:
                     # Part itself is too large, add it anyway
-                    chunks.append(part)
+                    chunks.append(text[pos:part_end])
             else:
-                if current_chunk:
-                    current_chunk += separator + part
+                if current_length:
+                    chunk_end = part_end
                 else:
-                    current_chunk = part
+                    chunk_start, chunk_end = pos, part_end
 
-        if current_chunk:
-            chunks.append(current_chunk)
+            if next_separator == -1:
+                break
+            pos = next_separator + separator_length
+
+        if chunk_end > chunk_start:
+            chunks.append(text[chunk_start:chunk_end])
 
         return chunks
 
@@ -319,26 +347,36 @@ class TextChunker:
             return []
 
         final_chunks = []
-        current_chunk = chunks[0]
+
+        # Accumulate pieces and join once per output chunk; repeated string
+        # concatenation is quadratic when a document splits into many tiny pieces
+        buf = [chunks[0]]
+        buf_len = len(chunks[0])
 
         for next_chunk in chunks[1:]:
             # If current chunk is too small, merge with next
-            if len(current_chunk) < self.chunk_size // 2:
-                current_chunk = current_chunk + " " + next_chunk
+            if buf_len < self.chunk_size // 2:
+                buf.append(" ")
+                buf.append(next_chunk)
+                buf_len += 1 + len(next_chunk)
             else:
                 # Add current chunk and start new one with overlap
+                current_chunk = "".join(buf)
                 final_chunks.append(current_chunk.strip())
 
                 # Add overlap from end of current chunk
-                if self.chunk_overlap > 0 and len(current_chunk) > self.chunk_overlap:
+                if self.chunk_overlap > 0 and buf_len > self.chunk_overlap:
                     overlap = current_chunk[-self.chunk_overlap:]
-                    current_chunk = overlap + " " + next_chunk
+                    buf = [overlap, " ", next_chunk]
+                    buf_len = len(overlap) + 1 + len(next_chunk)
                 else:
-                    current_chunk = next_chunk
+                    buf = [next_chunk]
+                    buf_len = len(next_chunk)
 
         # Add the last chunk
-        if current_chunk.strip():
-            final_chunks.append(current_chunk.strip())
+        current_chunk = "".join(buf).strip()
+        if current_chunk:
+            final_chunks.append(current_chunk)
 
         return final_chunks
 
@@ -449,52 +487,83 @@ class TextChunker:
         Returns:
             List of chunks with page information
         """
-        all_chunks = []
+        all_chunks = list(self.iter_pdf_by_pages(page_texts, metadata, document_id))
+
+        logger.info(f"Created {len(all_chunks)} chunks from {len(page_texts)} pages")
+
+        return all_chunks
+
+    def iter_pdf_by_pages(
+        self,
+        page_texts: List[str],
+        metadata: Dict[str, Any] = None,
+        document_id: str = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield PDF chunks one at a time while preserving page boundaries.
+
+        Pages are split up front so every chunk carries the final total_chunks,
+        but chunk dicts (metadata copies and quality scores) are only built as
+        the caller consumes them.
+
+        Args:
+            page_texts: List of text from each page
+            metadata: Document metadata
+            document_id: Document ID
+
+        Yields:
+            Chunks with page information, same shape as chunk_pdf_by_pages
+        """
         chunk_index = 0
+        metadata = metadata or {}
 
+        # Split every page first so total_chunks is known while building chunks
+        split_pages = []
         for page_num, page_text in enumerate(page_texts):
-            if not page_text.strip():
+            # Skip empty and whitespace-only (e.g. image-only scanned) pages
+            if not page_text or page_text.isspace():
                 continue
 
             # Extract table blocks for table-aware chunking
             table_blocks = self._extract_table_blocks(page_text)
 
             # Split page into chunks using table-aware method
-            page_chunks = self._split_text_table_aware(page_text, table_blocks)
+            split_pages.append((page_num, self._split_text_table_aware(page_text, table_blocks)))
+
+        total_chunks = sum(len(page_chunks) for _, page_chunks in split_pages)
+
+        for page_num, page_chunks in split_pages:
+            # Build the page-level metadata and ID prefix once per page
+            page_metadata = {
+                **metadata,
+                'page_number': page_num + 1,  # 1-indexed
+            }
+            id_prefix = f"{document_id}_page{page_num+1}_chunk" if document_id else f"page{page_num+1}_chunk"
 
             for i, chunk_text in enumerate(page_chunks):
+                quality = self._get_chunk_quality_score(chunk_text)
+
                 chunk = {
                     'content': chunk_text,
                     'metadata': {
-                        **(metadata or {}),
-                        'page_number': page_num + 1,  # 1-indexed
+                        **page_metadata,
                         'chunk_index': chunk_index,
                         'chunk_size': len(chunk_text),
                         'page_chunk_index': i,
                         'chunks_in_page': len(page_chunks),
+                        'total_chunks': total_chunks,
+                        # Quality metrics
+                        'quality_score': quality['quality_score'],
+                        'sentence_count': quality['sentence_count'],
+                        'word_count': quality['word_count'],
+                        'has_table': quality['has_table'],
+                        'table_count': quality['table_count'],
+                        'has_complete_table': quality.get('has_complete_table', False),
                     },
-                    'id': f"{document_id}_page{page_num+1}_chunk{i}" if document_id else f"page{page_num+1}_chunk{i}"
+                    'id': f"{id_prefix}{i}"
                 }
-                all_chunks.append(chunk)
+                yield chunk
                 chunk_index += 1
 
-        # Update total_chunks in metadata and add quality scores with all metadata
-        for chunk in all_chunks:
-            chunk['metadata']['total_chunks'] = len(all_chunks)
-            quality = self._get_chunk_quality_score(chunk['content'])
-
-            # Add all quality metrics to metadata
-            chunk['metadata']['quality_score'] = quality['quality_score']
-            chunk['metadata']['sentence_count'] = quality['sentence_count']
-            chunk['metadata']['word_count'] = quality['word_count']
-            chunk['metadata']['has_table'] = quality['has_table']
-            chunk['metadata']['table_count'] = quality['table_count']
-            chunk['metadata']['has_complete_table'] = quality.get('has_complete_table', False)
-
-        logger.info(f"Created {len(all_chunks)} chunks from {len(page_texts)} pages")
-
-        return all_chunks
-
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences using improved sentence boundary detection.
 
@@ -548,7 +617,6 @@ class TextChunker:
         # For table chunks, extract non-table text for sentence analysis
         if has_table:
             # Remove table markers and content for text analysis
-            import re
             text_only = re.sub(r'\[TABLE\s+\d+\].*?\[END TABLE\]', '', chunk, flags=re.DOTALL)
             sentence_count = len(self._split_into_sentences(text_only)) if text_only.strip() else 0
         else:
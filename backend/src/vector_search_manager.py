@@ -5,13 +5,29 @@ This module manages Vector Search index creation, document import, and querying
 with temporal context awareness.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+import asyncio
+import gzip
 import json
+import math
 import os
+import re
+import sys
+import time
 import traceback
+import zlib
+from dateutil import parser as date_parser
+from dotenv import set_key
+from google.api_core.exceptions import NotFound, PreconditionFailed
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import aiplatform
 from google.cloud import storage
+from requests.adapters import HTTPAdapter
 import vertexai
 
 from temporal_embeddings import TemporalEmbeddingHandler
@@ -19,6 +35,154 @@ from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Stored JSON is only read back by code, so it is written without indentation;
+# indent forces the pure-Python encoder while compact output uses the C encoder
+_COMPACT_JSON_SEPARATORS = (',', ':')
+
+# Keywords signalling that a query wants recent documents first. Matched as substrings
+# (like the original keyword list), so "currently" and "recently" count too
+_TEMPORAL_INTENT_PATTERN = re.compile(
+    r'latest|most recent|newest|current|recent|last|up to date|up-to-date|today'
+    r'|this year|this quarter|this month',
+    re.IGNORECASE
+)
+
+# Maximum datapoints sent in one UpsertDatapointsRequest
+_UPSERT_BATCH_SIZE = 1000
+
+# Datapoint IDs per RemoveDatapointsRequest, and how many removals run at once
+_REMOVE_BATCH_SIZE = 100
+_REMOVE_CONCURRENCY = 8
+
+# Blob deletes per GCS batch request (the JSON API's recommended maximum is 100)
+_DELETE_BATCH_SIZE = 100
+# Concurrent delete batches per prefix, and blobs per listing page (the API maximum);
+# deleting only needs blob names, so listings fetch nothing else
+_DELETE_WORKERS = 4
+_DELETE_LIST_PAGE_SIZE = 1000
+_DELETE_LIST_FIELDS = 'items(name),nextPageToken'
+
+# document_metadata is saved as this many shard blobs (documents are assigned by a
+# CRC32 of their ID) plus a manifest, so a save only uploads the shards that changed
+_METADATA_SHARDS = 16
+
+# Most concurrent queries sent together in one find_neighbors call
+_QUERY_BATCH_SIZE = 8
+
+# Concurrent chunk JSON uploads; each is a small independent PUT, so wall time is
+# dominated by round trips. The storage client's connection pool is sized to match
+_GCS_UPLOAD_WORKERS = 32
+
+# Chunk, batch and metadata JSON larger than this is stored gzip-encoded; GCS decompresses it on
+# the fly for clients that don't accept gzip, so chunk_json_url links keep working. Smaller
+# payloads gain too little to be worth the encoding overhead
+_GZIP_MIN_BYTES = 4096
+# Fast compression level: JSON text still shrinks several-fold, at a fraction of the CPU of level 9
+_GZIP_LEVEL = 3
+
+# File types list_gcs_files returns for import
+_SUPPORTED_EXTENSIONS = frozenset(('pdf', 'docx', 'txt', 'md', 'markdown'))
+
+# Blob fields list_gcs_files reads; requesting only these keeps listing pages small.
+# nextPageToken must stay included or iteration stops after the first page
+_LIST_BLOB_FIELDS = 'items(name,size,contentType,updated),prefixes,nextPageToken'
+
+# .env file that receives the resource names of newly created infrastructure
+_ENV_PATH = os.path.join(os.path.dirname(__file__), '.env')
+
+# Stored vectors whose L2 norm is within this distance of 1.0 are treated as unit
+# length and left untouched (text-embedding-005 already returns unit vectors)
+_UNIT_NORM_TOLERANCE = 1e-6
+
+# Maps filename characters that are unsafe in document IDs to underscores
+# (shared with the upload endpoint in main.py)
+SAFE_ID_TABLE = str.maketrans(". ", "__")
+
+# Metadata fields that are identical for every chunk of the same file
+_SHARED_METADATA_FIELDS = (
+    'filename', 'source', 'title', 'original_file_url', 'source_url',
+    'gcs_source_path', 'uploaded_at', 'document_date', 'document_type',
+    'content_type'
+)
+
+# Distinct dates seen when sorting results by recency; chunks of one file share theirs
+_SORT_DATE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_SORT_DATE_CACHE_SIZE)
+def _parse_sort_date(date_string: str) -> Optional[datetime]:
+    """Parse a document_date or uploaded_at value for recency sorting.
+
+    Args:
+        date_string: Date string from chunk metadata
+
+    Returns:
+        Parsed datetime, or None if the string cannot be parsed
+    """
+    # Normalized YYYY-MM-DD dates skip dateutil, which yields the same midnight datetime
+    if len(date_string) == 10 and date_string[4] == '-' and date_string[7] == '-':
+        try:
+            return datetime.fromisoformat(date_string)
+        except ValueError:
+            pass
+
+    try:
+        return date_parser.parse(date_string)
+    except Exception:
+        return None
+
+
+def _encode_json(value: Any) -> bytes:
+    """Encode a value as compact UTF-8 JSON."""
+    return json.dumps(value, separators=_COMPACT_JSON_SEPARATORS).encode('utf-8')
+
+
+def _metadata_shard(doc_id: str) -> int:
+    """Return the metadata shard a document belongs to (stable across processes)."""
+    return zlib.crc32(str(doc_id).encode('utf-8')) % _METADATA_SHARDS
+
+
+def _pooled_storage_client(project_id: str) -> storage.Client:
+    """Create a storage client whose HTTP session can hold a connection per upload worker.
+
+    requests keeps 10 connections per host by default; without a larger pool the
+    parallel uploads open and discard a fresh connection for every extra worker.
+    The session is built the way the client builds its own, with the pooled adapter
+    mounted before mTLS is configured so a client-certificate adapter still takes
+    over (keeping the pool size) when the environment enables it.
+
+    Args:
+        project_id: Google Cloud project ID
+
+    Returns:
+        Storage client using the pooled session
+    """
+    credentials, _ = google.auth.default(scopes=storage.Client.SCOPE)
+    session = AuthorizedSession(credentials)
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=_GCS_UPLOAD_WORKERS, pool_maxsize=_GCS_UPLOAD_WORKERS)
+    )
+    session.configure_mtls_channel()
+    return storage.Client(project=project_id, credentials=credentials, _http=session)
+
+
+def _upload_json(blob: storage.Blob, payload: bytes, if_generation_match: Optional[int] = None):
+    """Upload encoded JSON, gzip-encoded when it is large enough to benefit.
+
+    Args:
+        blob: Destination blob
+        payload: JSON bytes from _encode_json
+        if_generation_match: Only overwrite this generation of the blob (0: only create it)
+
+    Raises:
+        PreconditionFailed: If the blob is not at the expected generation
+    """
+    if len(payload) > _GZIP_MIN_BYTES:
+        blob.content_encoding = 'gzip'
+        payload = gzip.compress(payload, compresslevel=_GZIP_LEVEL)
+    blob.upload_from_string(payload, content_type='application/json', if_generation_match=if_generation_match)
+
 
 class VectorSearchManager:
     """Manages Vertex AI Vector Search operations."""
@@ -52,24 +216,74 @@ class VectorSearchManager:
         self.vector_search_index = vector_search_index
         self.vector_search_endpoint = vector_search_endpoint
 
+        # GCS object prefixes for this index, built once rather than on every save/load/clear
+        self._gcs_prefix = f"vector_search/{index_name}/"
+        self._metadata_prefix = f"{self._gcs_prefix}metadata/"
+
         # Initialize Vertex AI
         vertexai.init(project=project_id, location=location)
-        self.storage_client = storage.Client(project=project_id)
+        self.storage_client = _pooled_storage_client(project_id)
 
         # Index and endpoint objects
         self.index = None
         self.index_endpoint = None
         self.deployed_index_id = None
 
+        # Datapoint upsert/remove client, created on first use (see `index_client`)
+        self._index_client = None
+
+        # Handle for the default bucket, created on first use (see `bucket`)
+        self._bucket = None
+
+        # Neighbor queries waiting to be sent together (see `_find_neighbors`)
+        self._neighbor_queue: List[tuple] = []
+        self._neighbor_dispatch_task: Optional[asyncio.Task] = None
+
         # Document metadata cache for temporal context
         self.document_metadata: Dict[str, Dict[str, Any]] = {}
 
+        # CRC32 of each metadata shard as last saved to or loaded from GCS; empty when
+        # the shards and manifest in GCS are not known to match (see _save_metadata_to_gcs)
+        self._metadata_shard_crcs: Dict[int, int] = {}
+
+        # GCS generation of each metadata shard as last saved or loaded (0: known not to
+        # exist), used as a write precondition so concurrent writers do not lose updates
+        self._metadata_shard_generations: Dict[int, int] = {}
+
         # Load existing metadata from GCS if available
         self._load_metadata_from_gcs()
 
         # Try to load existing index and endpoint
         self._load_existing_resources()
 
+    @property
+    def index_client(self):
+        """Lazily create the IndexServiceClient used for datapoint upserts and removals.
+
+        The client holds a gRPC channel, so it is built once and reused by every
+        import instead of paying for a new channel and TLS handshake per call.
+        """
+        if self._index_client is None:
+            from google.cloud.aiplatform_v1.services.index_service import IndexServiceClient
+
+            self._index_client = IndexServiceClient(
+                client_options={"api_endpoint": f"{self.location}-aiplatform.googleapis.com"}
+            )
+        return self._index_client
+
+    @property
+    def bucket(self) -> storage.Bucket:
+        """Lazily create the handle for the default GCS bucket (gcs_bucket_name)."""
+        if self._bucket is None:
+            self._bucket = self.storage_client.bucket(self.gcs_bucket_name)
+        return self._bucket
+
+    def _get_bucket(self, bucket_name: Optional[str] = None) -> storage.Bucket:
+        """Return a bucket handle, reusing the cached one for the default bucket."""
+        if not bucket_name or bucket_name == self.gcs_bucket_name:
+            return self.bucket
+        return self.storage_client.bucket(bucket_name)
+
     def _load_existing_resources(self):
         """Load existing Vector Search resources if they exist."""
         try:
@@ -135,14 +349,26 @@ class VectorSearchManager:
         self,
         description: str = "Vector Search for Temporal RAG",
         dimensions: int = 768,
-        index_algorithm: str = "brute_force"
+        index_algorithm: str = "brute_force",
+        approximate_neighbors_count: int = 10,
+        leaf_node_embedding_count: int = 500,
+        leaf_nodes_to_search_percent: int = 7
     ) -> Dict[str, Any]:
         """Create Vector Search index and endpoint from scratch.
 
+        brute_force gives exact results and is fast enough below ~10K documents;
+        tree_ah (ScaNN) keeps query latency sub-linear for larger corpora at the
+        cost of approximate results. The tree_ah knobs trade recall for latency:
+        searching a higher percentage of leaves raises recall and query time.
+
         Args:
             description: Description of the index
             dimensions: Embedding dimensions (768 for text-embedding-005)
             index_algorithm: 'brute_force' (fast) or 'tree_ah' (production)
+            approximate_neighbors_count: tree_ah only; neighbors found by approximate
+                search before reordering (keep at or above the usual query top_k)
+            leaf_node_embedding_count: tree_ah only; embeddings per leaf node
+            leaf_nodes_to_search_percent: tree_ah only; percentage of leaves searched per query
 
         Returns:
             Resource names for index and endpoint
@@ -175,10 +401,10 @@ class VectorSearchManager:
                     contents_delta_uri=contents_delta_uri,
                     description=description,
                     dimensions=dimensions,
-                    approximate_neighbors_count=10,
+                    approximate_neighbors_count=approximate_neighbors_count,
                     distance_measure_type="DOT_PRODUCT_DISTANCE",
-                    leaf_node_embedding_count=500,
-                    leaf_nodes_to_search_percent=7,
+                    leaf_node_embedding_count=leaf_node_embedding_count,
+                    leaf_nodes_to_search_percent=leaf_nodes_to_search_percent,
                     index_update_method="STREAM_UPDATE",
                 )
                 machine_type = "e2-standard-16"
@@ -199,16 +425,19 @@ class VectorSearchManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.deployed_index_id = f"{self.index_name.replace('-', '_')}_{timestamp}"
 
+            # Deployment can take tens of minutes (longer for tree_ah), so it runs in
+            # the SDK's background thread; wait_for_deployment() awaits completion
             self.index_endpoint.deploy_index(
                 index=self.index,
                 deployed_index_id=self.deployed_index_id,
                 display_name=f"{self.index_name}-deployed",
                 machine_type=machine_type,
                 min_replica_count=1,
-                max_replica_count=1
+                max_replica_count=1,
+                sync=False
             )
 
-            logger.info("✓ Index deployed to endpoint")
+            logger.info("✓ Index deployment started")
 
             # Update instance variables
             self.vector_search_index = self.index.resource_name
@@ -221,7 +450,7 @@ class VectorSearchManager:
                 "index_resource_name": self.index.resource_name,
                 "endpoint_resource_name": self.index_endpoint.resource_name,
                 "deployed_index_id": self.deployed_index_id,
-                "status": "created",
+                "status": "deploying",
                 "created_at": datetime.now().isoformat()
             }
 
@@ -229,42 +458,39 @@ class VectorSearchManager:
             logger.error(f"Error creating Vector Search infrastructure: {str(e)}")
             raise
 
-    def _update_env_file(self, index_resource_name: str, endpoint_resource_name: str):
-        """Update .env file with Vector Search resource names."""
-        try:
-            env_path = os.path.join(os.path.dirname(__file__), '.env')
+    async def wait_for_deployment(self) -> Dict[str, Any]:
+        """Wait for a deployment started by create_vector_search_infrastructure.
 
-            if not os.path.exists(env_path):
-                logger.warning(f".env file not found at {env_path}")
-                return
-
-            # Read current .env content
-            with open(env_path, 'r') as f:
-                lines = f.readlines()
+        Returns immediately if nothing is deploying. The resource names are already
+        in .env, so after a restart the deployed indexes are read back from the
+        endpoint by _load_existing_resources.
 
-            # Update or add Vector Search variables
-            index_updated = False
-            endpoint_updated = False
+        Returns:
+            Deployment status and the deployed index IDs on the endpoint
+        """
+        if self.index_endpoint is None:
+            raise ValueError("Index endpoint not initialized. Create the infrastructure first.")
 
-            for i, line in enumerate(lines):
-                if line.startswith('VECTOR_SEARCH_INDEX='):
-                    lines[i] = f'VECTOR_SEARCH_INDEX={index_resource_name}\n'
-                    index_updated = True
-                elif line.startswith('VECTOR_SEARCH_INDEX_ENDPOINT='):
-                    lines[i] = f'VECTOR_SEARCH_INDEX_ENDPOINT={endpoint_resource_name}\n'
-                    endpoint_updated = True
+        # wait() blocks until the SDK's background deploy finishes and re-raises its error
+        await asyncio.to_thread(self.index_endpoint.wait)
+        logger.info("✓ Index deployed to endpoint")
 
-            # Add if not found
-            if not index_updated:
-                lines.append(f'\n# Vector Search Backend (auto-generated)\n')
-                lines.append(f'VECTOR_SEARCH_INDEX={index_resource_name}\n')
+        return {
+            "endpoint_resource_name": self.index_endpoint.resource_name,
+            "deployed_index_ids": [d.id for d in self.index_endpoint.deployed_indexes],
+            "status": "deployed"
+        }
 
-            if not endpoint_updated:
-                lines.append(f'VECTOR_SEARCH_INDEX_ENDPOINT={endpoint_resource_name}\n')
+    def _update_env_file(self, index_resource_name: str, endpoint_resource_name: str):
+        """Update .env file with Vector Search resource names."""
+        try:
+            if not os.path.exists(_ENV_PATH):
+                logger.warning(f".env file not found at {_ENV_PATH}")
+                return
 
-            # Write updated content
-            with open(env_path, 'w') as f:
-                f.writelines(lines)
+            # Update or add Vector Search variables (values stay unquoted, as before)
+            set_key(_ENV_PATH, 'VECTOR_SEARCH_INDEX', index_resource_name, quote_mode='never')
+            set_key(_ENV_PATH, 'VECTOR_SEARCH_INDEX_ENDPOINT', endpoint_resource_name, quote_mode='never')
 
             logger.info(f"✓ Updated .env file with Vector Search resource names")
 
@@ -308,37 +534,55 @@ class VectorSearchManager:
                 metadata_list
             )
 
-            # Prepare datapoints for Vector Search
+            # Prepare datapoints for Vector Search; every document in one import
+            # shares the same indexing time
+            indexed_at = datetime.now()
+            indexed_at_iso = indexed_at.isoformat()
+            indexed_at_ts = indexed_at.timestamp()
+
             datapoints = []
-            for i, (doc, embedding) in enumerate(zip(documents, embeddings)):
-                doc_id = doc.get('id', f"doc_{i}_{datetime.now().timestamp()}")
+            for i, (doc, content, metadata, embedding) in enumerate(
+                zip(documents, contents, metadata_list, embeddings)
+            ):
+                doc_id = doc['id'] if 'id' in doc else f"doc_{i}_{indexed_at_ts}"
 
-                # Create metadata with temporal info
-                metadata = doc.get('metadata', {})
-                metadata['content_preview'] = doc['content'][:200]
-                metadata['indexed_at'] = datetime.now().isoformat()
+                # Add temporal info to the metadata dict gathered for embedding above,
+                # in place rather than looking it up or copying it again
+                metadata['content_preview'] = content[:200]
+                metadata['indexed_at'] = indexed_at_iso
 
                 # Store full document metadata
                 self.document_metadata[doc_id] = {
                     'id': doc_id,
-                    'content': doc['content'],
+                    'content': content,
                     'metadata': metadata,
                     'source': metadata.get('source_url') or metadata.get('filename', 'Unknown'),
                     'title': metadata.get('title', metadata.get('filename', f'Document {i+1}'))
                 }
 
-                # Create datapoint for upsert
-                vector = embedding.tolist() if hasattr(embedding, 'tolist') else list(embedding)
+                # Create datapoint for upsert; the handler returns plain lists, which
+                # are passed through as-is instead of copied per document
+                if isinstance(embedding, list):
+                    vector = embedding
+                else:
+                    vector = embedding.tolist() if hasattr(embedding, 'tolist') else list(embedding)
+
+                # The index uses DOT_PRODUCT_DISTANCE, which only ranks like cosine
+                # similarity when stored vectors are unit length
+                norm = math.hypot(*vector)
+                if norm and abs(norm - 1.0) > _UNIT_NORM_TOLERANCE:
+                    vector = [value / norm for value in vector]
 
                 datapoints.append({
                     "datapoint_id": doc_id,
-                    "feature_vector": vector
+                    "feature_vector": vector,
+                    "restricts": self._datapoint_restricts(metadata)
                 })
 
             # Store chunk JSON files in GCS (optional for GCS imports)
             if store_chunk_json:
                 storage_bucket = bucket_name or self.gcs_bucket_name
-                gcs_paths = self._store_documents_in_gcs(storage_bucket, documents, datapoints)
+                gcs_paths = await asyncio.to_thread(self._store_documents_in_gcs, storage_bucket, documents, datapoints)
 
                 # Update metadata with chunk JSON paths (separate from original file)
                 for doc_id, gcs_path in gcs_paths.items():
@@ -359,31 +603,31 @@ class VectorSearchManager:
 
             # Upsert datapoints to index
             logger.info(f"Upserting {len(datapoints)} datapoints to index...")
-            from google.cloud.aiplatform_v1.services.index_service import IndexServiceClient
             from google.cloud.aiplatform_v1.types import UpsertDatapointsRequest, IndexDatapoint
 
-            client = IndexServiceClient(client_options={"api_endpoint": f"{self.location}-aiplatform.googleapis.com"})
-
-            # Build IndexDatapoint objects
-            index_datapoints = []
-            for dp in datapoints:
-                datapoint = IndexDatapoint({
-                    "datapoint_id": dp["datapoint_id"],
-                    "feature_vector": dp["feature_vector"]
-                })
-                index_datapoints.append(datapoint)
+            client = self.index_client
 
-            # Send upsert request
-            request = UpsertDatapointsRequest(
-                index=self.vector_search_index,
-                datapoints=index_datapoints
-            )
+            # Upsert in fixed-size requests so only one batch of protobuf datapoints
+            # exists at a time and large imports stay under the request size limit
+            for start in range(0, len(datapoints), _UPSERT_BATCH_SIZE):
+                batch = datapoints[start:start + _UPSERT_BATCH_SIZE]
+                request = UpsertDatapointsRequest(
+                    index=self.vector_search_index,
+                    datapoints=[
+                        IndexDatapoint({
+                            "datapoint_id": dp["datapoint_id"],
+                            "feature_vector": dp["feature_vector"],
+                            "restricts": dp["restricts"]
+                        })
+                        for dp in batch
+                    ]
+                )
+                client.upsert_datapoints(request=request)
 
-            response = client.upsert_datapoints(request=request)
             logger.info(f"✓ Successfully upserted {len(datapoints)} vectors to index!")
 
             # Save metadata to GCS for persistence
-            self._save_metadata_to_gcs()
+            await self._save_metadata_to_gcs()
 
             return {
                 "status": "imported",
@@ -396,6 +640,36 @@ class VectorSearchManager:
             logger.error(f"Error importing documents: {str(e)}")
             raise
 
+    def _datapoint_restricts(self, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build Vector Search restricts (namespace tags) from chunk metadata.
+
+        Tagged datapoints can be pre-filtered during the neighbor search by passing
+        a Namespace filter to find_neighbors, instead of fetching top_k and
+        discarding non-matching results afterwards.
+
+        Args:
+            metadata: Chunk metadata
+
+        Returns:
+            Restricts for the metadata that is present ('source', 'document_type', 'year')
+        """
+        restricts = []
+
+        source = metadata.get('filename') or metadata.get('source')
+        if source:
+            restricts.append({"namespace": "source", "allow_list": [source]})
+
+        document_type = metadata.get('document_type')
+        if document_type:
+            restricts.append({"namespace": "document_type", "allow_list": [document_type]})
+
+        # document_date is normalized to YYYY-MM-DD when it could be parsed
+        year = (metadata.get('document_date') or '')[:4]
+        if year.isdigit():
+            restricts.append({"namespace": "year", "allow_list": [year]})
+
+        return restricts
+
     async def query(
         self,
         query_text: str,
@@ -424,16 +698,11 @@ class VectorSearchManager:
 
             # Query the index using find_neighbors
             logger.info(f"Searching for {top_k} nearest neighbors...")
-            response = self.index_endpoint.find_neighbors(
-                deployed_index_id=self.deployed_index_id,
-                queries=[query_vector],
-                num_neighbors=top_k
-            )
+            neighbors = await self._find_neighbors(query_vector, top_k)
 
             # Parse results
             results = []
-            if response and len(response) > 0:
-                neighbors = response[0]  # First query results
+            if neighbors:
                 logger.info(f"Found {len(neighbors)} neighbors")
 
                 for neighbor in neighbors:
@@ -443,21 +712,23 @@ class VectorSearchManager:
                     # Get document metadata
                     doc_info = self.document_metadata.get(doc_id, {})
                     metadata = doc_info.get('metadata', {})
+                    content = doc_info.get('content', '')
 
                     # Create result
                     result = {
                         "id": doc_id,
                         "score": distance,  # DOT_PRODUCT_DISTANCE (higher is better)
                         "title": doc_info.get('title', 'Unknown Document'),
-                        "content": doc_info.get('content', ''),
-                        "content_preview": doc_info.get('content', '')[:300] + '...' if len(doc_info.get('content', '')) > 300 else doc_info.get('content', ''),
+                        "content": content,
+                        "content_preview": f"{content[:300]}..." if len(content) > 300 else content,
                         "metadata": metadata,
                         "source_uri": doc_info.get('gcs_url', ''),
                         "citation": self._format_citation(doc_id, doc_info, score=distance)
                     }
                     results.append(result)
 
-            # Sort by score descending (best match first)
+            # Sort by score descending (best match first); the temporal filter and the
+            # stable recency sort below both preserve this order, so it is sorted once
             if results:
                 results.sort(key=lambda x: x['score'], reverse=True)
 
@@ -478,10 +749,6 @@ class VectorSearchManager:
                     effective_filter = implicit_filter
                     temporal_filter_applied = True
 
-            # Re-sort by score after filtering
-            if results:
-                results.sort(key=lambda x: x['score'], reverse=True)
-
             # Detect temporal intent and sort by date if needed
             has_temporal_intent = self._detect_temporal_intent(query_text)
             if has_temporal_intent and results:
@@ -503,15 +770,66 @@ class VectorSearchManager:
             logger.error(f"Error querying index: {str(e)}")
             raise
 
+    async def _find_neighbors(self, query_vector: List[float], top_k: int) -> List[Any]:
+        """Find nearest neighbors, sharing find_neighbors calls with concurrent queries.
+
+        The first query is sent at once. Queries that arrive while a call is in
+        flight are queued and sent together in the next call, so concurrent users
+        share request round trips without adding any wait to a lone query.
+
+        Args:
+            query_vector: Query embedding
+            top_k: Number of neighbors to return
+
+        Returns:
+            Neighbors for this query, best match first
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._neighbor_queue.append((query_vector, top_k, future))
+
+        if self._neighbor_dispatch_task is None:
+            self._neighbor_dispatch_task = asyncio.create_task(self._dispatch_neighbor_queries())
+
+        return await future
+
+    async def _dispatch_neighbor_queries(self):
+        """Send queued neighbor queries until the queue is empty."""
+        try:
+            while self._neighbor_queue:
+                batch = self._neighbor_queue[:_QUERY_BATCH_SIZE]
+                del self._neighbor_queue[:_QUERY_BATCH_SIZE]
+
+                # num_neighbors applies to the whole call, so queries are grouped by top_k
+                groups: Dict[int, List[tuple]] = {}
+                for query in batch:
+                    groups.setdefault(query[1], []).append(query)
+
+                for top_k, queries in groups.items():
+                    try:
+                        response = await asyncio.to_thread(
+                            self.index_endpoint.find_neighbors,
+                            deployed_index_id=self.deployed_index_id,
+                            queries=[query_vector for query_vector, _, _ in queries],
+                            num_neighbors=top_k
+                        )
+                    except Exception as e:
+                        for _, _, future in queries:
+                            if not future.done():
+                                future.set_exception(e)
+                        continue
+
+                    if len(queries) > 1:
+                        logger.info(f"Sent {len(queries)} concurrent queries in one find_neighbors call")
+
+                    for i, (_, _, future) in enumerate(queries):
+                        if not future.done():
+                            future.set_result(response[i] if response and i < len(response) else [])
+        finally:
+            self._neighbor_dispatch_task = None
+
     def _detect_temporal_intent(self, query_text: str) -> bool:
         """Detect if query has temporal intent."""
-        temporal_keywords = [
-            'latest', 'most recent', 'newest', 'current', 'recent',
-            'last', 'up to date', 'up-to-date', 'today', 'this year',
-            'this quarter', 'this month'
-        ]
-        query_lower = query_text.lower()
-        return any(keyword in query_lower for keyword in temporal_keywords)
+        return _TEMPORAL_INTENT_PATTERN.search(query_text) is not None
 
     def _extract_temporal_filter_from_query(self, query_text: str) -> Optional[Dict[str, Any]]:
         """Extract temporal filter criteria from query text with date normalization."""
@@ -549,31 +867,24 @@ class VectorSearchManager:
         if not temporal_filter or not results:
             return results
 
-        filtered = []
-        filter_type = None
-        filter_value = None
-
+        # Choose the comparison once instead of per result
         if 'document_date' in temporal_filter:
-            filter_type = 'date'
+            # Prefix match: "2023-01" matches "2023-01-15"
             filter_value = temporal_filter['document_date']
+            filtered = [
+                result for result in results
+                if result.get('metadata', {}).get('document_date', '').startswith(filter_value)
+            ]
         elif 'year' in temporal_filter:
-            filter_type = 'year'
+            # Substring match: "2023" matches "Q1 2023" and "2023-12"
             filter_value = temporal_filter['year']
-
-        if not filter_type:
+            filtered = [
+                result for result in results
+                if filter_value in result.get('metadata', {}).get('document_date', '')
+            ]
+        else:
             return results
 
-        for result in results:
-            metadata = result.get('metadata', {})
-            doc_date = metadata.get('document_date', '')
-
-            if filter_type == 'date':
-                if doc_date.startswith(filter_value):
-                    filtered.append(result)
-            elif filter_type == 'year':
-                if filter_value in doc_date:
-                    filtered.append(result)
-
         logger.info(f"Temporal filter applied: {len(filtered)}/{len(results)} results matched")
         return filtered
 
@@ -581,22 +892,14 @@ class VectorSearchManager:
         """Sort results by document date (most recent first)."""
         def get_date_key(result):
             metadata = result.get('metadata', {})
-            doc_date = metadata.get('document_date')
-
-            if doc_date:
-                try:
-                    from dateutil import parser
-                    return parser.parse(doc_date)
-                except:
-                    pass
 
-            uploaded_at = metadata.get('uploaded_at')
-            if uploaded_at:
-                try:
-                    from dateutil import parser
-                    return parser.parse(uploaded_at)
-                except:
-                    pass
+            # Parsed dates are cached, so repeated queries don't re-run dateutil
+            for field in ('document_date', 'uploaded_at'):
+                value = metadata.get(field)
+                if value and isinstance(value, str):
+                    parsed = _parse_sort_date(value)
+                    if parsed is not None:
+                        return parsed
 
             return datetime.min
 
@@ -661,40 +964,32 @@ class VectorSearchManager:
         if 'document_date' in metadata:
             citation['date'] = metadata['document_date']
 
-        # Build enhanced formatted citation string
-        citation_parts = []
-
-        # Title with page and chunk location
-        title_part = citation['title']
-        location_info = []
-
-        if citation.get('page_number') is not None:
-            location_info.append(f"Page {citation['page_number']}")
-
-        if citation.get('page_chunk_index') is not None:
-            location_info.append(f"Chunk {citation['page_chunk_index']}")
-        elif citation.get('chunk_index') is not None:
-            location_info.append(f"Chunk {citation['chunk_index']}")
-
-        if location_info:
-            title_part += f" ({', '.join(location_info)})"
-
-        citation_parts.append(title_part)
-
-        # Add document date if available
-        if citation.get('date'):
-            citation_parts.append(f"Date: {citation['date']}")
-
-        # Add relevance score if available
-        if citation.get('score') is not None:
-            citation_parts.append(f"Relevance: {citation['score']}")
-
-        # Add source filename if not Unknown
-        if citation.get('source') != 'Unknown':
-            citation_parts.append(f"Source: {citation['source']}")
-
-        # Main formatted string (pipe-separated for readability)
-        citation['formatted'] = ' | '.join(citation_parts)
+        # Page and chunk location shown after the title
+        page_number = citation.get('page_number')
+        chunk_number = citation.get('page_chunk_index')
+        if chunk_number is None:
+            chunk_number = citation.get('chunk_index')
+
+        if page_number is not None and chunk_number is not None:
+            location = f" (Page {page_number}, Chunk {chunk_number})"
+        elif page_number is not None:
+            location = f" (Page {page_number})"
+        elif chunk_number is not None:
+            location = f" (Chunk {chunk_number})"
+        else:
+            location = ""
+
+        date = citation.get('date')
+        relevance = citation.get('score')
+        source = citation.get('source')
+
+        # Main formatted string (pipe-separated for readability), built in one pass
+        citation['formatted'] = (
+            f"{citation['title']}{location}"
+            f"{f' | Date: {date}' if date else ''}"
+            f"{f' | Relevance: {relevance}' if relevance is not None else ''}"
+            f"{f' | Source: {source}' if source != 'Unknown' else ''}"
+        )
 
         # Formatted version with clickable link
         if citation.get('clickable_link'):
@@ -720,7 +1015,7 @@ class VectorSearchManager:
     def _ensure_bucket_exists(self):
         """Ensure the GCS bucket exists."""
         try:
-            bucket = self.storage_client.bucket(self.gcs_bucket_name)
+            bucket = self.bucket
             if not bucket.exists():
                 logger.info(f"Creating GCS bucket: {self.gcs_bucket_name}")
                 bucket = self.storage_client.create_bucket(
@@ -742,10 +1037,10 @@ class VectorSearchManager:
     ) -> str:
         """Store original uploaded file in GCS."""
         try:
-            bucket = self.storage_client.bucket(bucket_name or self.gcs_bucket_name)
+            bucket = self._get_bucket(bucket_name)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-            blob_name = f"vector_search/{self.index_name}/original_files/{timestamp}_{filename}"
+            blob_name = f"{self._gcs_prefix}original_files/{timestamp}_{filename}"
             blob = bucket.blob(blob_name)
 
             blob.upload_from_string(
@@ -789,15 +1084,15 @@ class VectorSearchManager:
                 }
             )
 
-            bucket = self.storage_client.bucket(bucket_name)
+            bucket = self._get_bucket(bucket_name)
 
-            # List blobs with prefix
+            # List blobs with prefix (pages are fetched lazily while iterating)
             if recursive:
                 # Get all blobs under prefix (including subfolders)
-                blobs = bucket.list_blobs(prefix=prefix)
+                blobs = bucket.list_blobs(prefix=prefix, fields=_LIST_BLOB_FIELDS)
             else:
                 # Get only blobs directly under prefix (no subfolders)
-                blobs = bucket.list_blobs(prefix=prefix, delimiter='/')
+                blobs = bucket.list_blobs(prefix=prefix, delimiter='/', fields=_LIST_BLOB_FIELDS)
 
             files = []
             for blob in blobs:
@@ -810,8 +1105,7 @@ class VectorSearchManager:
                 file_ext = filename.split('.')[-1].lower() if '.' in filename else ''
 
                 # Only include supported file types
-                supported_extensions = ['pdf', 'docx', 'txt', 'md', 'markdown']
-                if file_ext not in supported_extensions:
+                if file_ext not in _SUPPORTED_EXTENSIONS:
                     logger.debug(
                         "Skipping unsupported file type",
                         extra={'document_filename': filename, 'extension': file_ext}
@@ -867,7 +1161,7 @@ class VectorSearchManager:
             bucket_name = path_parts[0]
             blob_name = path_parts[1]
 
-            bucket = self.storage_client.bucket(bucket_name)
+            bucket = self._get_bucket(bucket_name)
             blob = bucket.blob(blob_name)
 
             if not blob.exists():
@@ -934,7 +1228,7 @@ class VectorSearchManager:
             )
 
             # List files from GCS path
-            files = self.list_gcs_files(gcs_path, recursive=recursive)
+            files = await asyncio.to_thread(self.list_gcs_files, gcs_path, recursive=recursive)
 
             if not files:
                 return {
@@ -953,6 +1247,9 @@ class VectorSearchManager:
             imported_files = []
             failed_files = []
 
+            # All files in one import share the same upload timestamp
+            uploaded_at = datetime.now().isoformat(timespec='seconds')
+
             for file_info in files:
                 try:
                     logger.info(
@@ -964,34 +1261,37 @@ class VectorSearchManager:
                     )
 
                     # Download file content
-                    file_bytes = self.download_gcs_file(file_info['gcs_path'])
+                    file_bytes = await asyncio.to_thread(self.download_gcs_file, file_info['gcs_path'])
 
-                    # Parse document
-                    parsed = DocumentParser.parse_document(
-                        file_bytes,
-                        file_info['filename'],
-                        file_info.get('content_type')
-                    )
+                    # Parse document (PDFs in a single pass with page breakdown)
+                    if DocumentParser.is_pdf(file_info['filename'], file_info.get('content_type')):
+                        parsed = DocumentParser.parse_pdf_full(file_bytes)
+                    else:
+                        parsed = DocumentParser.parse_document(
+                            file_bytes,
+                            file_info['filename'],
+                            file_info.get('content_type')
+                        )
 
                     # Create base metadata BEFORE chunking
                     base_metadata = {
                         'filename': file_info['filename'],
                         'source': file_info['filename'],
-                        'title': file_info['filename'].rsplit('.', 1)[0],
+                        'title': file_info['filename'].rpartition('.')[0] or file_info['filename'],
                         'original_file_url': file_info['public_url'],
                         'source_url': file_info['public_url'],
                         'gcs_source_path': file_info['gcs_path'],
                         'imported_from_gcs': True,
-                        'uploaded_at': datetime.now().isoformat()
+                        'uploaded_at': uploaded_at
                     }
 
                     # Create document ID
-                    document_id = f"{file_info['filename'].replace('.', '_').replace(' ', '_')}_{int(datetime.now().timestamp())}"
+                    document_id = f"{file_info['filename'].translate(SAFE_ID_TABLE)}_{time.time_ns() // 1_000_000_000}"
 
                     # Chunk the document
                     if parsed['type'] == 'pdf':
-                        # Use parse_pdf_by_pages for PDFs
-                        pdf_result = DocumentParser.parse_pdf_by_pages(file_bytes)
+                        # Page-level results come from the same parse
+                        pdf_result = parsed
 
                         # Add PDF-specific metadata
                         base_metadata.update({
@@ -1121,30 +1421,33 @@ class VectorSearchManager:
         """Store documents in GCS."""
         gcs_paths = {}
         try:
-            bucket = self.storage_client.bucket(bucket_name)
+            bucket = self._get_bucket(bucket_name)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-            # Store individual documents
+            # Store individual documents; the path prefixes are the same for every document
+            documents_prefix = f"{self._gcs_prefix}documents/"
+            gcs_prefix = f"gs://{bucket_name}/"
+            uploads = []
             for i, doc in enumerate(documents):
-                doc_id = doc.get('id', f"doc_{i}_{timestamp}")
-                doc_blob_name = f"vector_search/{self.index_name}/documents/{doc_id}.json"
-                doc_blob = bucket.blob(doc_blob_name)
+                doc_id = doc['id'] if 'id' in doc else f"doc_{i}_{timestamp}"
+                doc_blob_name = f"{documents_prefix}{doc_id}.json"
+                uploads.append((doc_blob_name, doc))
 
-                doc_blob.upload_from_string(
-                    json.dumps(doc, indent=2),
-                    content_type='application/json'
-                )
+                gcs_paths[doc_id] = f"{gcs_prefix}{doc_blob_name}"
 
-                gcs_paths[doc_id] = f"gs://{bucket_name}/{doc_blob_name}"
+            def upload_json(upload):
+                blob_name, value = upload
+                _upload_json(bucket.blob(blob_name), _encode_json(value))
 
             # Store batch for backup
-            batch_blob_name = f"vector_search/{self.index_name}/batches/documents_{timestamp}.json"
-            batch_blob = bucket.blob(batch_blob_name)
+            batch_blob_name = f"{self._gcs_prefix}batches/documents_{timestamp}.json"
 
-            batch_blob.upload_from_string(
-                json.dumps(documents, indent=2),
-                content_type='application/json'
-            )
+            # Upload concurrently, with the (largest) batch backup started first so it
+            # overlaps the chunk uploads; result() and list() re-raise the first failure
+            with ThreadPoolExecutor(max_workers=_GCS_UPLOAD_WORKERS) as executor:
+                batch_upload = executor.submit(upload_json, (batch_blob_name, documents))
+                list(executor.map(upload_json, uploads))
+                batch_upload.result()
 
             logger.info(f"Stored {len(documents)} documents in GCS")
             return gcs_paths
@@ -1153,70 +1456,283 @@ class VectorSearchManager:
             logger.error(f"Error storing in GCS: {str(e)}")
             raise
 
-    def _save_metadata_to_gcs(self):
-        """Save document metadata to GCS for persistence."""
-        try:
-            metadata_path = f"vector_search/{self.index_name}/metadata/document_metadata.json"
-            bucket = self.storage_client.bucket(self.gcs_bucket_name)
-            blob = bucket.blob(metadata_path)
+    async def _save_metadata_to_gcs(self, merge_remote: bool = True):
+        """Save document metadata to GCS for persistence.
+
+        Documents are split into _METADATA_SHARDS shard blobs, and only shards whose
+        contents changed since the last save or load are uploaded, so adding a few
+        documents no longer rewrites the metadata of the whole corpus.
 
-            metadata_json = json.dumps(self.document_metadata, indent=2)
-            blob.upload_from_string(metadata_json, content_type='application/json')
+        The shards are encoded on the calling (event loop) thread, where
+        document_metadata is otherwise mutated; only the encoded bytes are handed to
+        a worker thread for upload (see _upload_metadata_shards).
 
-            logger.info(f"✓ Saved metadata for {len(self.document_metadata)} documents to GCS")
+        Args:
+            merge_remote: Whether to merge in another writer's documents on conflict.
+                False when the metadata was just cleared, so removed documents are
+                overwritten rather than brought back.
+        """
+        try:
+            shards = [{} for _ in range(_METADATA_SHARDS)]
+            for doc_id, doc_info in self.document_metadata.items():
+                shards[_metadata_shard(doc_id)][doc_id] = doc_info
+
+            # The generation each payload was encoded against is captured with it, so an
+            # overlapping save that wrote the shard in the meantime fails our precondition
+            changed = {}
+            for i, shard in enumerate(shards):
+                payload = _encode_json(shard)
+                crc = zlib.crc32(payload)
+                if self._metadata_shard_crcs.get(i) != crc:
+                    changed[i] = (payload, crc, self._metadata_shard_generations.get(i, 0))
+
+            remote_documents = await asyncio.to_thread(self._upload_metadata_shards, changed, merge_remote)
+            for doc_id, doc_info in remote_documents.items():
+                self.document_metadata.setdefault(doc_id, doc_info)
+
+            logger.info(
+                f"✓ Saved metadata for {len(self.document_metadata)} documents to GCS "
+                f"({len(changed)}/{_METADATA_SHARDS} shards changed)"
+            )
         except Exception as e:
             logger.warning(f"Could not save metadata to GCS: {str(e)}")
 
+    def _upload_metadata_shards(
+        self,
+        changed: Dict[int, Tuple[bytes, int, int]],
+        merge_remote: bool
+    ) -> Dict[str, Dict[str, Any]]:
+        """Upload encoded metadata shards, then the manifest if the layout is new.
+
+        Shards are written with a generation precondition (shards never seen by this
+        process must not exist yet). If another save, in this process or another, has
+        written a shard since its payload was encoded, the documents missing here are
+        merged in (ours win on conflict) and the write is retried once.
+
+        Args:
+            changed: Encoded payload, CRC32 and expected generation by shard number
+            merge_remote: Whether to merge in another writer's documents on conflict
+
+        Returns:
+            The other writers' documents, for the caller to merge into document_metadata
+        """
+        metadata_prefix = self._metadata_prefix
+        bucket = self.bucket
+        remote_documents = {}
+
+        def upload_shard(item):
+            i, (payload, _, expected_generation) = item
+            blob = bucket.blob(f"{metadata_prefix}shard_{i:02d}.json")
+            try:
+                # download_as_bytes() in _load_metadata_from_gcs decodes the gzip transparently
+                _upload_json(blob, payload, expected_generation)
+            except PreconditionFailed:
+                remote = bucket.blob(blob.name)
+                try:
+                    remote_shard = json.loads(remote.download_as_bytes())
+                    generation = remote.generation
+                except NotFound:
+                    remote_shard, generation = {}, 0
+
+                if merge_remote:
+                    logger.warning(f"Metadata shard {i} was changed by another writer, merging")
+                    remote_documents.update(remote_shard)
+                    # A shard written under another shard count can hold documents that belong elsewhere
+                    remote_shard = {doc_id: doc_info for doc_id, doc_info in remote_shard.items()
+                                    if _metadata_shard(doc_id) == i}
+                    payload = _encode_json({**remote_shard, **json.loads(payload)})
+                else:
+                    logger.warning(f"Metadata shard {i} was changed by another writer, overwriting")
+                _upload_json(blob, payload, generation)
+                changed[i] = (payload, zlib.crc32(payload), generation)
+
+            self._metadata_shard_generations[i] = blob.generation
+
+        with ThreadPoolExecutor(max_workers=_METADATA_SHARDS) as executor:
+            list(executor.map(upload_shard, list(changed.items())))
+
+        # The manifest goes last, so it never points at shards that were not written
+        if not self._metadata_shard_crcs:
+            _upload_json(
+                bucket.blob(f"{metadata_prefix}manifest.json"),
+                _encode_json({'shards': _METADATA_SHARDS})
+            )
+
+        self._metadata_shard_crcs.update((i, crc) for i, (_, crc, _) in changed.items())
+        return remote_documents
+
     def _load_metadata_from_gcs(self):
-        """Load document metadata from GCS."""
+        """Load document metadata from GCS.
+
+        Reads the sharded layout written by _save_metadata_to_gcs, falling back to
+        the single document_metadata.json blob written by earlier versions.
+        """
         try:
-            metadata_path = f"vector_search/{self.index_name}/metadata/document_metadata.json"
-            bucket = self.storage_client.bucket(self.gcs_bucket_name)
-            blob = bucket.blob(metadata_path)
+            metadata_prefix = self._metadata_prefix
+            bucket = self.bucket
+
+            try:
+                manifest = json.loads(bucket.blob(f"{metadata_prefix}manifest.json").download_as_bytes())
+            except NotFound:
+                manifest = None
+
+            if manifest is None:
+                # Download directly rather than probing with exists() first: one request, not two
+                try:
+                    metadata_json = bucket.blob(f"{metadata_prefix}document_metadata.json").download_as_text()
+                except NotFound:
+                    return
 
-            if blob.exists():
-                metadata_json = blob.download_as_text()
                 self.document_metadata = json.loads(metadata_json)
+                self._intern_shared_metadata()
                 logger.info(f"✓ Loaded metadata for {len(self.document_metadata)} documents from GCS")
+                return
+
+            shard_count = manifest['shards']
+
+            def download_shard(i):
+                blob = bucket.blob(f"{metadata_prefix}shard_{i:02d}.json")
+                try:
+                    return blob.download_as_bytes(), blob.generation
+                except NotFound:
+                    # An empty shard that was never written
+                    return None, 0
+
+            with ThreadPoolExecutor(max_workers=shard_count) as executor:
+                downloads = list(executor.map(download_shard, range(shard_count)))
+
+            document_metadata = {}
+            shard_crcs = {}
+            for i, (payload, _) in enumerate(downloads):
+                if payload is not None:
+                    document_metadata.update(json.loads(payload))
+                    shard_crcs[i] = zlib.crc32(payload)
+
+            self.document_metadata = document_metadata
+            # With a different shard count, the next save rewrites every shard and the manifest
+            if shard_count == _METADATA_SHARDS:
+                self._metadata_shard_crcs = shard_crcs
+                self._metadata_shard_generations = {i: generation for i, (_, generation) in enumerate(downloads)}
+            else:
+                self._metadata_shard_crcs = {}
+                self._metadata_shard_generations = {}
+            self._intern_shared_metadata()
+            logger.info(f"✓ Loaded metadata for {len(self.document_metadata)} documents from GCS")
         except Exception as e:
             if "404" not in str(e):
                 logger.warning(f"Could not load metadata from GCS: {str(e)}")
 
+    def _intern_shared_metadata(self):
+        """Intern per-file string fields so all chunks of a file share one copy.
+
+        JSON decoding creates a separate string for every chunk's filename, URLs,
+        etc., even though they are identical for all chunks of the same file.
+        """
+        for doc_info in self.document_metadata.values():
+            for field in ('source', 'title'):
+                if isinstance(doc_info.get(field), str):
+                    doc_info[field] = sys.intern(doc_info[field])
+
+            metadata = doc_info.get('metadata', {})
+            for field in _SHARED_METADATA_FIELDS:
+                if isinstance(metadata.get(field), str):
+                    metadata[field] = sys.intern(metadata[field])
+
     def _clear_all_gcs_files(self):
         """Clear all GCS files and folders associated with this index."""
+        # The metadata shards and manifest are deleted too, so the next save writes them all
+        self._metadata_shard_crcs = {}
+        self._metadata_shard_generations = {}
+
         try:
-            bucket = self.storage_client.bucket(self.gcs_bucket_name)
+            bucket = self.bucket
 
             # List of prefixes to delete
             prefixes_to_clear = [
-                f"vector_search/{self.index_name}/documents/",      # Document JSON files
-                f"vector_search/{self.index_name}/batches/",         # Batch files
-                f"vector_search/{self.index_name}/original_files/",  # Original uploaded files
-                f"vector_search/{self.index_name}/metadata/",        # Metadata files
+                f"{self._gcs_prefix}documents/",       # Document JSON files
+                f"{self._gcs_prefix}batches/",         # Batch files
+                f"{self._gcs_prefix}original_files/",  # Original uploaded files
+                self._metadata_prefix,                 # Metadata files
             ]
 
-            total_deleted = 0
-            for prefix in prefixes_to_clear:
-                # List all blobs with this prefix
-                blobs = bucket.list_blobs(prefix=prefix)
-                blobs_list = list(blobs)
-
-                if blobs_list:
-                    logger.info(f"Deleting {len(blobs_list)} files from {prefix}")
-
-                    # Delete in batches
-                    for blob in blobs_list:
-                        try:
-                            blob.delete()
-                            total_deleted += 1
-                        except Exception as e:
-                            logger.warning(f"Could not delete {blob.name}: {str(e)}")
+            # Prefixes are independent, so each is listed and deleted by its own worker
+            with ThreadPoolExecutor(max_workers=len(prefixes_to_clear)) as executor:
+                total_deleted = sum(executor.map(
+                    lambda prefix: self._clear_gcs_prefix(bucket, prefix),
+                    prefixes_to_clear
+                ))
 
             logger.info(f"Cleared {total_deleted} total files from GCS")
 
         except Exception as e:
             logger.warning(f"Error clearing GCS files: {str(e)}")
 
+    def _clear_gcs_prefix(self, bucket: storage.Bucket, prefix: str) -> int:
+        """Delete every blob under a prefix.
+
+        Args:
+            bucket: Bucket to clear
+            prefix: Blob name prefix
+
+        Returns:
+            Number of blobs deleted
+        """
+        deleted = 0
+        pending = deque()
+
+        # Each listed page is split into delete batches (one multipart request each)
+        # that run while the next page is fetched; waiting on the oldest batch once
+        # enough are queued keeps memory bounded for very large prefixes
+        with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as executor:
+            try:
+                pages = bucket.list_blobs(
+                    prefix=prefix, page_size=_DELETE_LIST_PAGE_SIZE, fields=_DELETE_LIST_FIELDS
+                ).pages
+                for page in pages:
+                    page_blobs = list(page)
+                    for start in range(0, len(page_blobs), _DELETE_BATCH_SIZE):
+                        if len(pending) >= 2 * _DELETE_WORKERS:
+                            deleted += pending.popleft().result()
+                        pending.append(executor.submit(
+                            self._delete_blob_batch, page_blobs[start:start + _DELETE_BATCH_SIZE]
+                        ))
+            except Exception as e:
+                logger.warning(f"Could not list files under {prefix}: {str(e)}")
+
+            deleted += sum(future.result() for future in pending)
+
+        if deleted:
+            logger.info(f"Deleted {deleted} files from {prefix}")
+        return deleted
+
+    def _delete_blob_batch(self, blobs: List[storage.Blob]) -> int:
+        """Delete blobs with a single GCS batch request.
+
+        Args:
+            blobs: Blobs to delete (at most _DELETE_BATCH_SIZE)
+
+        Returns:
+            Number of blobs deleted
+        """
+        try:
+            # raise_exception=False keeps one failed delete from hiding the others' results
+            with self.storage_client.batch(raise_exception=False) as batch:
+                for blob in blobs:
+                    blob.delete()
+        except Exception as e:
+            logger.warning(f"Could not delete batch of {len(blobs)} files: {str(e)}")
+            return 0
+
+        # The with block discards finish()'s return value, so the per-request results
+        # are read from where it stores them (requirements.txt pins the major version)
+        deleted = 0
+        for blob, response in zip(blobs, batch._responses):
+            if 200 <= response.status_code < 300:
+                deleted += 1
+            else:
+                logger.warning(f"Could not delete {blob.name}: HTTP {response.status_code}")
+        return deleted
+
     def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a document by ID."""
         doc_info = self.document_metadata.get(document_id)
@@ -1255,39 +1771,46 @@ class VectorSearchManager:
             logger.info(f"Clearing {len(datapoint_ids)} datapoints from index...")
 
             # Use IndexServiceClient to remove datapoints
-            from google.cloud.aiplatform_v1.services.index_service import IndexServiceClient
             from google.cloud.aiplatform_v1.types import RemoveDatapointsRequest
 
-            client = IndexServiceClient(
-                client_options={"api_endpoint": f"{self.location}-aiplatform.googleapis.com"}
-            )
-
-            # Remove datapoints in batches (API has limits)
-            batch_size = 100
-            total_removed = 0
+            client = self.index_client
 
-            for i in range(0, len(datapoint_ids), batch_size):
-                batch = datapoint_ids[i:i + batch_size]
+            # Remove datapoints in batches (API has limits), several requests in flight
+            # at a time; each call blocks, so it runs in a worker thread
+            semaphore = asyncio.Semaphore(_REMOVE_CONCURRENCY)
 
+            async def remove_batch(batch_number: int, batch: List[str]) -> int:
                 request = RemoveDatapointsRequest(
                     index=self.vector_search_index,
                     datapoint_ids=batch
                 )
 
-                try:
-                    client.remove_datapoints(request=request)
-                    total_removed += len(batch)
-                    logger.info(f"Removed batch {i//batch_size + 1}: {len(batch)} datapoints")
-                except Exception as e:
-                    logger.warning(f"Error removing batch: {str(e)}")
-                    # Continue with other batches
+                async with semaphore:
+                    try:
+                        await asyncio.to_thread(client.remove_datapoints, request=request)
+                    except Exception as e:
+                        logger.warning(f"Error removing batch: {str(e)}")
+                        # Continue with other batches
+                        return 0
 
-            # Clear metadata
-            self.document_metadata = {}
-            self._save_metadata_to_gcs()
+                logger.info(f"Removed batch {batch_number}: {len(batch)} datapoints")
+                return len(batch)
 
-            # Clear all GCS files
-            self._clear_all_gcs_files()
+            async def clear_gcs():
+                await self._save_metadata_to_gcs(merge_remote=False)
+                await asyncio.to_thread(self._clear_all_gcs_files)
+
+            # Clear metadata; the GCS cleanup touches none of the index's resources,
+            # so it runs alongside the removals
+            self.document_metadata = {}
+            removed_counts, _ = await asyncio.gather(
+                asyncio.gather(*(
+                    remove_batch(start // _REMOVE_BATCH_SIZE + 1, datapoint_ids[start:start + _REMOVE_BATCH_SIZE])
+                    for start in range(0, len(datapoint_ids), _REMOVE_BATCH_SIZE)
+                )),
+                clear_gcs()
+            )
+            total_removed = sum(removed_counts)
 
             logger.info(f"Successfully cleared {total_removed} datapoints from index and all GCS files")
 
@@ -1299,7 +1822,6 @@ class VectorSearchManager:
 
         except Exception as e:
             logger.error(f"Error clearing datapoints: {str(e)}")
-            import traceback
             logger.error(traceback.format_exc())
             return {
                 "success": False,
@@ -1348,33 +1870,69 @@ class VectorSearchManager:
             # Undeploy and delete endpoint
             if self.index_endpoint:
                 try:
-                    if self.index_endpoint.deployed_indexes:
-                        for deployed_index in self.index_endpoint.deployed_indexes:
-                            logger.info(f"Undeploying index: {deployed_index.id}")
-                            self.index_endpoint.undeploy_index(deployed_index_id=deployed_index.id)
-                            deleted_resources.append(f"Undeployed index: {deployed_index.id}")
+                    # A deployment started by create_vector_search_infrastructure must finish first.
+                    # wait() re-raises a failed background deploy on every call, so log it and
+                    # re-read the endpoint (dropping the stored error) before tearing it down
+                    try:
+                        await asyncio.to_thread(self.index_endpoint.wait)
+                    except Exception as e:
+                        logger.warning(f"Index deployment failed, continuing with deletion: {str(e)}")
+                        self.index_endpoint = await asyncio.to_thread(
+                            aiplatform.MatchingEngineIndexEndpoint,
+                            index_endpoint_name=self.index_endpoint.resource_name
+                        )
+
+                    deployed_index_ids = [d.id for d in self.index_endpoint.deployed_indexes]
+                    if deployed_index_ids:
+                        # Start every undeploy operation, then wait on them together, so the
+                        # teardown takes as long as the slowest undeploy rather than their sum
+                        operations = []
+                        for deployed_index_id in deployed_index_ids:
+                            logger.info(f"Undeploying index: {deployed_index_id}")
+                            operations.append(self.index_endpoint.api_client.undeploy_index(
+                                index_endpoint=self.index_endpoint.resource_name,
+                                deployed_index_id=deployed_index_id
+                            ))
+
+                        await asyncio.gather(*(asyncio.to_thread(operation.result) for operation in operations))
+                        deleted_resources.extend(
+                            f"Undeployed index: {deployed_index_id}" for deployed_index_id in deployed_index_ids
+                        )
+                except Exception as e:
+                    logger.error(f"Error deleting endpoint: {str(e)}")
+                    raise
 
+            async def delete_endpoint() -> str:
+                try:
                     logger.info(f"Deleting endpoint...")
-                    self.index_endpoint.delete(force=True)
-                    deleted_resources.append(f"Deleted endpoint: {self.index_endpoint.display_name}")
+                    await asyncio.to_thread(self.index_endpoint.delete, force=True)
+                    return f"Deleted endpoint: {self.index_endpoint.display_name}"
                 except Exception as e:
                     logger.error(f"Error deleting endpoint: {str(e)}")
                     raise
 
-            # Delete index
-            if self.index:
+            async def delete_index() -> str:
                 try:
                     logger.info(f"Deleting index...")
-                    self.index.delete()
-                    deleted_resources.append(f"Deleted index: {self.index.display_name}")
+                    await asyncio.to_thread(self.index.delete)
+                    return f"Deleted index: {self.index.display_name}"
                 except Exception as e:
                     logger.error(f"Error deleting index: {str(e)}")
                     raise
 
+            # With nothing deployed, the endpoint and index no longer depend on each other,
+            # so both delete operations run at once, off the event loop
+            deletions = []
+            if self.index_endpoint:
+                deletions.append(delete_endpoint())
+            if self.index:
+                deletions.append(delete_index())
+            deleted_resources.extend(await asyncio.gather(*deletions))
+
             logger.info("✓ Vector Search infrastructure deletion completed")
 
             # Clear all GCS files
-            self._clear_all_gcs_files()
+            await asyncio.to_thread(self._clear_all_gcs_files)
             deleted_resources.append("Cleared all GCS files")
 
             # Clear metadata
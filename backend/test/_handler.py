@@ -0,0 +1,14 @@
+"""Shared TemporalEmbeddingHandler for the script-style date tests.
+
+Imported once per process, so every test module in a run reuses the same instance.
+"""
+
+from temporal_embeddings import TemporalEmbeddingHandler
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+project_id = os.getenv('GOOGLE_CLOUD_PROJECT', 'test-project')
+location = os.getenv('GOOGLE_CLOUD_LOCATION', 'us-central1')
+handler = TemporalEmbeddingHandler(project_id, location)
@@ -13,4 +13,7 @@ backend_dir = Path(__file__).parent.parent
 src_dir = backend_dir / 'src'
 sys.path.insert(0, str(src_dir))
 
+# Add the test directory so script-style tests can share helpers (e.g. _handler)
+sys.path.insert(0, str(Path(__file__).parent))
+
 print(f"Test suite initialized. Source directory: {src_dir}")
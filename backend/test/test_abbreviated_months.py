@@ -1,15 +1,6 @@
 """Test abbreviated month date normalization"""
 
-from temporal_embeddings import TemporalEmbeddingHandler
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-# Init
-project_id = os.getenv('GOOGLE_CLOUD_PROJECT', 'test-project')
-location = os.getenv('GOOGLE_CLOUD_LOCATION', 'us-central1')
-handler = TemporalEmbeddingHandler(project_id, location)
+from _handler import handler
 
 print("Testing abbreviated month normalization:")
 print("=" * 80)
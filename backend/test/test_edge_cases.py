@@ -15,6 +15,7 @@ Tests:
 import sys
 import os
 from pathlib import Path
+from collections import defaultdict
 from datetime import datetime
 
 # Add parent directory to path for imports
@@ -203,12 +204,9 @@ def test_temporal_context_truncation():
     temporal_entities = handler.extract_temporal_info(text)
 
     # Group entities by type for display
-    entity_types = {}
+    entity_types = defaultdict(list)
     for entity in temporal_entities:
-        etype = entity['type']
-        if etype not in entity_types:
-            entity_types[etype] = []
-        entity_types[etype].append(entity['value'])
+        entity_types[entity['type']].append(entity['value'])
 
     for key, values in entity_types.items():
         if values:
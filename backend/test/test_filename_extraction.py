@@ -1,15 +1,6 @@
 """Test filename date extraction for problematic formats"""
 
-from temporal_embeddings import TemporalEmbeddingHandler
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-# Init
-project_id = os.getenv('GOOGLE_CLOUD_PROJECT', 'test-project')
-location = os.getenv('GOOGLE_CLOUD_LOCATION', 'us-central1')
-handler = TemporalEmbeddingHandler(project_id, location)
+from _handler import handler
 
 print("Testing filename date extraction:")
 print("=" * 80)
@@ -33,3 +24,19 @@ for filename in test_filenames:
     print(f"{status} {filename:40} -> {extracted}")
 
 print("=" * 80)
+
+# Day-first names: the day must stand alone, so "v2" is not read as a day
+expected_dates = {
+    "Invoice 3 Sep 2023.pdf": "2023-09-03",
+    "notes v2 Dec 2023.pdf": "2023-12",
+}
+
+print("Day-first filenames:")
+print("=" * 80)
+
+for filename, expected in expected_dates.items():
+    extracted = handler.extract_date_from_filename(filename)
+    status = "✓" if extracted == expected else "✗"
+    print(f"{status} {filename:40} -> {extracted} (expected {expected})")
+
+print("=" * 80)
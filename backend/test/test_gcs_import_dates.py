@@ -3,25 +3,24 @@ Comprehensive test that simulates GCS import date extraction logic
 Tests all files in test_pdfs/ folder
 """
 
-from temporal_embeddings import TemporalEmbeddingHandler
+from _handler import handler
+import io
 import os
-from dotenv import load_dotenv
+import sys
 from pathlib import Path
 
-load_dotenv()
-
-# Init
-project_id = os.getenv('GOOGLE_CLOUD_PROJECT', 'test-project')
-location = os.getenv('GOOGLE_CLOUD_LOCATION', 'us-central1')
-handler = TemporalEmbeddingHandler(project_id, location)
-
 print("=" * 100)
 print("GCS IMPORT DATE EXTRACTION TEST - All test_pdfs files")
 print("=" * 100)
 
 # Get all PDF files from test_pdfs directory
 test_pdfs_dir = Path("/Users/Pallab documents/agent-temporal-context/backend/test_pdfs")
-pdf_files = sorted(test_pdfs_dir.glob("*.pdf"))
+# scandir entries carry their file type, so no per-file stat or fnmatch is needed
+pdf_files = sorted(
+    (Path(entry.path) for entry in os.scandir(test_pdfs_dir)
+     if entry.is_file() and entry.name.lower().endswith('.pdf')),
+    key=lambda path: path.name
+) if test_pdfs_dir.is_dir() else []
 
 print(f"\nFound {len(pdf_files)} PDF files to test\n")
 
@@ -32,6 +31,9 @@ results = {
     'invalid_date': []
 }
 
+# Per-file lines are buffered and written once after the loop
+buf = io.StringIO()
+
 # Test each file through the GCS import logic
 for pdf_file in pdf_files:
     filename = pdf_file.name
@@ -52,15 +54,17 @@ for pdf_file in pdf_files:
     status = "✓" if is_valid else "✗"
 
     if is_valid:
-        print(f"{status} {filename:45} | Extracted: {extracted_date:20} | Final: {normalized_date}")
+        buf.write(f"{status} {filename:45} | Extracted: {extracted_date:20} | Final: {normalized_date}\n")
         results['success'].append(filename)
     elif extracted_date and not normalized_date:
-        print(f"{status} {filename:45} | Extracted: {extracted_date:20} | Normalization FAILED")
+        buf.write(f"{status} {filename:45} | Extracted: {extracted_date:20} | Normalization FAILED\n")
         results['invalid_date'].append((filename, extracted_date))
     else:
-        print(f"{status} {filename:45} | No date extracted from filename")
+        buf.write(f"{status} {filename:45} | No date extracted from filename\n")
         results['failed'].append(filename)
 
+sys.stdout.write(buf.getvalue())
+
 # Summary
 print("\n" + "=" * 100)
 print("SUMMARY")
@@ -3,18 +3,11 @@ Test that metadata is created correctly for GCS import
 Simulates the exact metadata that would be stored in Vector Search
 """
 
-from temporal_embeddings import TemporalEmbeddingHandler
-import os
-from dotenv import load_dotenv
+from _handler import handler
+import io
+import sys
 from datetime import datetime
 
-load_dotenv()
-
-# Init
-project_id = os.getenv('GOOGLE_CLOUD_PROJECT', 'test-project')
-location = os.getenv('GOOGLE_CLOUD_LOCATION', 'us-central1')
-handler = TemporalEmbeddingHandler(project_id, location)
-
 print("=" * 100)
 print("METADATA CREATION TEST - Simulating GCS import metadata")
 print("=" * 100)
@@ -30,6 +23,12 @@ test_cases = [
 
 print("\nSimulating metadata that would be stored in Vector Search:\n")
 
+# One upload timestamp for the whole batch, as in the GCS import
+uploaded_at = datetime.utcnow().isoformat()
+
+# Per-case blocks are buffered and written once after the loop
+buf = io.StringIO()
+
 for filename in test_cases:
     # Simulate the GCS import metadata creation logic
     extracted_date = handler.extract_date_from_filename(filename)
@@ -43,7 +42,7 @@ for filename in test_cases:
     metadata = {
         'filename': filename,
         'document_date': document_date if document_date else 'UNKNOWN',
-        'uploaded_at': datetime.utcnow().isoformat(),
+        'uploaded_at': uploaded_at,
         'imported_from_gcs': True
     }
 
@@ -51,13 +50,15 @@ for filename in test_cases:
     is_valid = metadata['document_date'] != 'UNKNOWN' and len(metadata['document_date']) == 10
     status = "✓" if is_valid else "✗"
 
-    print(f"{status} File: {filename:35}")
-    print(f"   Metadata: {{")
-    print(f"     'filename': '{metadata['filename']}',")
-    print(f"     'document_date': '{metadata['document_date']}',  {'<-- CORRECT!' if is_valid else '<-- WRONG!'}")
-    print(f"     'uploaded_at': '{metadata['uploaded_at'][:19]}',")
-    print(f"     'imported_from_gcs': True")
-    print(f"   }}\n")
+    buf.write(f"{status} File: {filename:35}\n")
+    buf.write(f"   Metadata: {{\n")
+    buf.write(f"     'filename': '{metadata['filename']}',\n")
+    buf.write(f"     'document_date': '{metadata['document_date']}',  {'<-- CORRECT!' if is_valid else '<-- WRONG!'}\n")
+    buf.write(f"     'uploaded_at': '{metadata['uploaded_at'][:19]}',\n")
+    buf.write(f"     'imported_from_gcs': True\n")
+    buf.write(f"   }}\n\n")
+
+sys.stdout.write(buf.getvalue())
 
 print("=" * 100)
 print("KEY POINT: document_date should be YYYY-MM-DD format, NOT just year!")
@@ -1,15 +1,6 @@
 """Test that ordinal suffix removal doesn't break month names"""
 
-from temporal_embeddings import TemporalEmbeddingHandler
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-# Init
-project_id = os.getenv('GOOGLE_CLOUD_PROJECT', 'test-project')
-location = os.getenv('GOOGLE_CLOUD_LOCATION', 'us-central1')
-handler = TemporalEmbeddingHandler(project_id, location)
+from _handler import handler
 
 print("Testing ordinal suffix fix:")
 print("=" * 80)
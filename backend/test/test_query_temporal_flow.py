@@ -10,6 +10,7 @@ This demonstrates the query flow:
 
 import sys
 import os
+import re
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -17,6 +18,13 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from temporal_embeddings import TemporalEmbeddingHandler
 from typing import Dict, Any, List
 
+# Same keyword pattern as VectorSearchManager._detect_temporal_intent
+TEMPORAL_INTENT_PATTERN = re.compile(
+    r'latest|most recent|newest|current|recent|last|up to date|up-to-date|today'
+    r'|this year|this quarter|this month',
+    re.IGNORECASE
+)
+
 
 def simulate_vector_search_query():
     """Simulate the query flow with temporal context extraction."""
@@ -93,13 +101,7 @@ def simulate_vector_search_query():
             print(f"    ⚠ No temporal entities found in query")
 
         # Step 3: Check for temporal intent keywords
-        temporal_keywords = [
-            'latest', 'most recent', 'newest', 'current', 'recent',
-            'last', 'up to date', 'up-to-date', 'today', 'this year',
-            'this quarter', 'this month'
-        ]
-        query_lower = query.lower()
-        has_temporal_intent = any(keyword in query_lower for keyword in temporal_keywords)
+        has_temporal_intent = TEMPORAL_INTENT_PATTERN.search(query) is not None
 
         print(f"  ✓ Step 3: Check temporal intent")
         if has_temporal_intent:
@@ -136,30 +138,23 @@ def simulate_vector_search_query():
         print(f"Filter: {filter_test['description']}")
         print(f"  Criteria: {filter_criteria}")
 
-        # Apply filter
+        # Apply filter (same comparisons as VectorSearchManager._apply_temporal_filter)
         filtered = []
-        filter_type = None
-        filter_value = None
 
         if 'document_date' in filter_criteria:
-            filter_type = 'date'
+            # Uses startswith for prefix matching
             filter_value = filter_criteria['document_date']
+            filtered = [
+                result for result in mock_results
+                if result.get('metadata', {}).get('document_date', '').startswith(filter_value)
+            ]
         elif 'year' in filter_criteria:
-            filter_type = 'year'
+            # Uses 'in' for substring matching
             filter_value = filter_criteria['year']
-
-        for result in mock_results:
-            metadata = result.get('metadata', {})
-            doc_date = metadata.get('document_date', '')
-
-            if filter_type == 'date':
-                # Uses startswith for prefix matching
-                if doc_date.startswith(filter_value):
-                    filtered.append(result)
-            elif filter_type == 'year':
-                # Uses 'in' for substring matching
-                if filter_value in doc_date:
-                    filtered.append(result)
+            filtered = [
+                result for result in mock_results
+                if filter_value in result.get('metadata', {}).get('document_date', '')
+            ]
 
         print(f"  Results: {len(filtered)}/{len(mock_results)} documents matched")
         for doc in filtered:
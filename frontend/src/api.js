@@ -19,6 +19,12 @@ export const createIndex = async (description, dimensions = 768, indexAlgorithm
   return response.data;
 };
 
+// Resolves once the deployment started by createIndex has finished
+export const waitForIndexDeployment = async () => {
+  const response = await api.get('/index/deployment');
+  return response.data;
+};
+
 export const getIndexInfo = async () => {
   const response = await api.get('/index/info');
   return response.data;
@@ -22,13 +22,14 @@ import InfoIcon from '@mui/icons-material/Info';
 import DeleteIcon from '@mui/icons-material/Delete';
 import ClearIcon from '@mui/icons-material/Clear';
 import CheckCircleIcon from '@mui/icons-material/CheckCircle';
-import { createIndex, getIndexInfo, clearIndexDatapoints, deleteIndex } from '../api';
+import { createIndex, waitForIndexDeployment, getIndexInfo, clearIndexDatapoints, deleteIndex } from '../api';
 
 function IndexManager() {
   const [description, setDescription] = useState('Temporal Context Vector Search Index');
   const [dimensions, setDimensions] = useState(768);
   const [indexAlgorithm, setIndexAlgorithm] = useState('brute_force');
   const [loading, setLoading] = useState(false);
+  const [deploying, setDeploying] = useState(false);
   const [indexInfo, setIndexInfo] = useState(null);
   const [message, setMessage] = useState(null);
   const [error, setError] = useState(null);
@@ -61,19 +62,41 @@ function IndexManager() {
     try {
       const response = await createIndex(description, dimensions, indexAlgorithm);
 
-      if (response.success) {
+      if (!response.success) {
+        setError(response.error || 'Failed to create index');
+        return;
+      }
+
+      // The index is only queryable once its deployment to the endpoint finishes
+      let details = response.data;
+      if (response.data?.status === 'deploying') {
+        setDeploying(true);
         setMessage({
-          type: 'success',
-          text: 'Vector Search index created and deployed successfully! Resource names saved to .env file.',
-          details: response.data,
+          type: 'info',
+          text: 'Vector Search index created. Deploying it to the endpoint; this can take several minutes...',
+          details,
         });
-        await loadIndexInfo();
-      } else {
-        setError(response.error || 'Failed to create index');
+
+        const deployment = await waitForIndexDeployment();
+        if (!deployment.success) {
+          setMessage(null);
+          setError(deployment.error || 'Index deployment failed');
+          return;
+        }
+        details = { ...details, ...deployment.data };
       }
+
+      setMessage({
+        type: 'success',
+        text: 'Vector Search index created and deployed successfully! Resource names saved to .env file.',
+        details,
+      });
+      await loadIndexInfo();
     } catch (err) {
+      setMessage(null);
       setError(err.response?.data?.detail || err.message || 'Failed to create index');
     } finally {
+      setDeploying(false);
       setLoading(false);
     }
   };
@@ -320,7 +343,7 @@ function IndexManager() {
                   fullWidth
                   size="large"
                 >
-                  {loading ? 'Creating Index...' : 'Create Index & Deploy'}
+                  {loading ? (deploying ? 'Deploying Index...' : 'Creating Index...') : 'Create Index & Deploy'}
                 </Button>
               </Grid>
             </Grid>